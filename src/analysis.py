@@ -5,10 +5,18 @@ Improved with dynamic lag detection and significance testing
 
 import numpy as np
 import pandas as pd
+from scipy import fft as sp_fft
 from scipy import stats
 from dataclasses import dataclass
 from typing import Optional, Tuple
 
+# Optional numba JIT for the lead/lag scan (FFT fallback otherwise)
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 
 @dataclass
 class CorrelationResult:
@@ -105,6 +113,74 @@ def calculate_correlation(es_prices: np.ndarray, btc_prices: np.ndarray) -> Corr
     )
 
 
+def _lagged_corr_kernel(x: np.ndarray, y: np.ndarray, max_lag: int) -> np.ndarray:
+    """corr(x[:n-lag], y[lag:]) for lag = 0..max_lag, one fused pass per lag (numba target)"""
+    n = x.shape[0]
+    out = np.empty(max_lag + 1)
+    for lag in range(max_lag + 1):
+        m = n - lag
+        sx = sy = sxx = syy = sxy = 0.0
+        for i in range(m):
+            a = x[i]
+            b = y[i + lag]
+            sx += a
+            sy += b
+            sxx += a * a
+            syy += b * b
+            sxy += a * b
+        var_x = m * sxx - sx * sx
+        var_y = m * syy - sy * sy
+        if var_x > 0.0 and var_y > 0.0:
+            out[lag] = (m * sxy - sx * sy) / np.sqrt(var_x * var_y)
+        else:
+            out[lag] = np.nan
+    return out
+
+
+def _lagged_corr_fft(x: np.ndarray, y: np.ndarray, max_lag: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Both directions of _lagged_corr_kernel at once: (x leads, y leads) for lag = 0..max_lag
+
+    Every lag's cross sum comes out of a single zero-padded real FFT product, and the
+    per-window sums / sums of squares from prefix sums, so the cost is O(n log n) rather
+    than one O(n) pass per lag and direction.
+    """
+    n = len(x)
+    size = sp_fft.next_fast_len(2 * n - 1, real=True)
+    # cc[k] = sum_i x[i] * y[i + k]; negative k wraps to the end of the buffer
+    cc = sp_fft.irfft(np.conj(sp_fft.rfft(x, size)) * sp_fft.rfft(y, size), size)
+    lags = np.arange(max_lag + 1)
+    m = n - lags
+
+    def prefix(a: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return np.concatenate(([0.0], np.cumsum(a))), np.concatenate(([0.0], np.cumsum(a * a)))
+
+    cx, cxx = prefix(x)
+    cy, cyy = prefix(y)
+
+    def corr(sxy, head, head_sq, tail, tail_sq):
+        # head = the leading series over [0, m), tail = the lagging one over [lag, n)
+        sa, saa = head[m], head_sq[m]
+        sb, sbb = tail[n] - tail[lags], tail_sq[n] - tail_sq[lags]
+        var_a = m * saa - sa * sa
+        var_b = m * sbb - sb * sb
+        denom = np.sqrt(np.where((var_a > 0) & (var_b > 0), var_a * var_b, np.nan))
+        return (m * sxy - sa * sb) / denom
+
+    x_leads = corr(cc[lags], cx, cxx, cy, cyy)
+    y_leads = corr(cc[(size - lags) % size], cy, cyy, cx, cxx)
+    return x_leads, y_leads
+
+
+if HAS_NUMBA:
+    _lagged_corr_jit = njit(cache=True)(_lagged_corr_kernel)
+
+    def _lagged_correlations(x: np.ndarray, y: np.ndarray, max_lag: int) -> Tuple[np.ndarray, np.ndarray]:
+        """(x leads, y leads) via the compiled per-lag kernel (cheaper than FFT at these sizes)"""
+        return _lagged_corr_jit(x, y, max_lag), _lagged_corr_jit(y, x, max_lag)
+else:
+    _lagged_correlations = _lagged_corr_fft
+
+
 def calculate_lead_lag(es_returns: np.ndarray, btc_returns: np.ndarray,
                        max_lag: int = None) -> Tuple[int, float]:
     """
@@ -140,26 +216,14 @@ def calculate_lead_lag(es_returns: np.ndarray, btc_returns: np.ndarray,
     es_norm = (es_returns - np.mean(es_returns)) / es_std
     btc_norm = (btc_returns - np.mean(btc_returns)) / btc_std
 
-    # Cross-correlation at different lags
+    # Cross-correlation at every lag, both directions in one call
+    # es_leads[lag]: ES[:-lag] vs BTC[lag:]; btc_leads[lag]: BTC[:-lag] vs ES[lag:]
+    es_leads, btc_leads = _lagged_correlations(es_norm, btc_norm, max_lag)
     correlations = []
     for lag in range(-max_lag, max_lag + 1):
-        if lag < 0:
-            # BTC leads: compare BTC[:-|lag|] with ES[|lag|:]
-            abs_lag = abs(lag)
-            if abs_lag >= len(btc_norm):
-                continue
-            corr_val = np.corrcoef(btc_norm[:-abs_lag], es_norm[abs_lag:])[0, 1]
-        elif lag > 0:
-            # ES leads: compare ES[:-lag] with BTC[lag:]
-            if lag >= len(es_norm):
-                continue
-            corr_val = np.corrcoef(es_norm[:-lag], btc_norm[lag:])[0, 1]
-        else:
-            # Synchronous
-            corr_val = np.corrcoef(es_norm, btc_norm)[0, 1]
-
+        corr_val = btc_leads[-lag] if lag < 0 else es_leads[lag]
         if np.isfinite(corr_val):
-            correlations.append((lag, corr_val))
+            correlations.append((lag, float(corr_val)))
 
     if not correlations:
         return 0, 0.0
@@ -193,6 +257,41 @@ def normalize_prices(es_prices: np.ndarray, btc_prices: np.ndarray) -> Tuple[np.
     return es_norm, btc_norm
 
 
+def rolling_correlation(x: np.ndarray, y: np.ndarray, window: int) -> np.ndarray:
+    """
+    Pearson correlation for every full sliding window of `window` samples
+
+    Uses running sums (Σx, Σy, Σxy, Σx², Σy²) so each window costs O(1)
+    instead of a fresh corrcoef pass. Windows with no variance yield NaN.
+    """
+    n = min(len(x), len(y))
+    if window < 2 or n < window:
+        return np.array([])
+
+    # Center first so the running sums stay well-conditioned
+    x = np.asarray(x[-n:], dtype=np.float64)
+    y = np.asarray(y[-n:], dtype=np.float64)
+    x = x - x.mean()
+    y = y - y.mean()
+
+    def window_sums(a: np.ndarray) -> np.ndarray:
+        c = np.concatenate(([0.0], np.cumsum(a)))
+        return c[window:] - c[:-window]
+
+    sum_x, sum_y = window_sums(x), window_sums(y)
+    sum_xx, sum_yy, sum_xy = window_sums(x * x), window_sums(y * y), window_sums(x * y)
+
+    cov = window * sum_xy - sum_x * sum_y
+    var_x = window * sum_xx - sum_x * sum_x
+    var_y = window * sum_yy - sum_y * sum_y
+
+    # Treat rounding-level variance as flat (corrcoef would return NaN there)
+    valid = (var_x > 1e-10 * window * sum_xx) & (var_y > 1e-10 * window * sum_yy)
+    corr = np.full(len(cov), np.nan)
+    corr[valid] = cov[valid] / np.sqrt(var_x[valid] * var_y[valid])
+    return np.clip(corr, -1.0, 1.0)
+
+
 def calculate_divergence(es_prices: np.ndarray, btc_prices: np.ndarray,
                          window: int = 20) -> np.ndarray:
     """
@@ -212,16 +311,31 @@ def calculate_divergence(es_prices: np.ndarray, btc_prices: np.ndarray,
     es_ret = np.diff(es) / (es[:-1] + 1e-10)
     btc_ret = np.diff(btc) / (btc[:-1] + 1e-10)
 
-    # Rolling correlation
-    divergence = np.zeros(len(es_ret) - window + 1)
-    for i in range(len(divergence)):
-        corr = np.corrcoef(es_ret[i:i+window], btc_ret[i:i+window])[0, 1]
-        if np.isfinite(corr):
-            divergence[i] = max(0, -corr)  # 0 when correlated, up to 1 when anti-correlated
-        else:
-            divergence[i] = 0
+    # Rolling correlation: 0 when correlated, up to 1 when anti-correlated
+    corr = rolling_correlation(es_ret, btc_ret, window)
+    return np.where(np.isfinite(corr), np.maximum(0, -corr), 0.0)
+
+
+def _time_sorted(ts_ns: np.ndarray, close: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(ts, close) in time order; bar rings are already sorted, so usually a no-op check"""
+    if len(ts_ns) > 1 and (ts_ns[1:] < ts_ns[:-1]).any():
+        order = np.argsort(ts_ns, kind='stable')
+        return ts_ns[order], close[order]
+    return ts_ns, close
 
-    return divergence
+
+def _resample_last_close(ts_ns: np.ndarray, close: np.ndarray, minutes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Last close per `minutes` bucket from time-sorted epoch-ns timestamps
+
+    Returns (bucket ids, closes), one entry per bucket - the ndarray
+    equivalent of resample(f'{minutes}min').agg({'close': 'last'}).
+    """
+    buckets = ts_ns // (minutes * 60_000_000_000)
+    last = np.empty(len(buckets), dtype=bool)
+    last[:-1] = buckets[1:] != buckets[:-1]
+    last[-1:] = True
+    return buckets[last], close[last]
 
 
 class MultiTimeframeAnalysis:
@@ -248,6 +362,24 @@ class MultiTimeframeAnalysis:
         if 'timestamp' in self.btc_df.columns and not pd.api.types.is_datetime64_any_dtype(self.btc_df['timestamp']):
             self.btc_df['timestamp'] = pd.to_datetime(self.btc_df['timestamp'], utc=True)
 
+    # (es_ts, es_close, btc_ts, btc_close) when built via from_arrays
+    _arrays = None
+
+    @classmethod
+    def from_arrays(cls, es_ts: np.ndarray, es_close: np.ndarray,
+                    btc_ts: np.ndarray, btc_close: np.ndarray) -> 'MultiTimeframeAnalysis':
+        """
+        Initialize from epoch-ns timestamp and close arrays (no DataFrames)
+
+        Only closes feed the correlation, so this skips building and
+        resampling full OHLCV frames. Each side is put in time order once
+        here rather than per timeframe.
+        """
+        analysis = cls.__new__(cls)
+        analysis.es_df = analysis.btc_df = None
+        analysis._arrays = (*_time_sorted(es_ts, es_close), *_time_sorted(btc_ts, btc_close))
+        return analysis
+
     def resample(self, df: pd.DataFrame, minutes: int) -> pd.DataFrame:
         """Resample to higher timeframe"""
         if minutes == 1:
@@ -274,6 +406,9 @@ class MultiTimeframeAnalysis:
 
     def analyze_all(self) -> dict:
         """Calculate correlation for all timeframes"""
+        if self._arrays is not None:
+            return self._analyze_arrays()
+
         results = {}
 
         for tf_name, minutes in self.TIMEFRAMES.items():
@@ -309,6 +444,38 @@ class MultiTimeframeAnalysis:
 
         return results
 
+    def _analyze_arrays(self) -> dict:
+        """analyze_all over raw close arrays: bucket, intersect, correlate"""
+        es_ts, es_close, btc_ts, btc_close = self._arrays
+        results = {}
+
+        for tf_name, minutes in self.TIMEFRAMES.items():
+            try:
+                es_buckets, es_closes = _resample_last_close(es_ts, es_close, minutes)
+                btc_buckets, btc_closes = _resample_last_close(btc_ts, btc_close, minutes)
+
+                if len(es_buckets) < 10 or len(btc_buckets) < 10:
+                    results[tf_name] = CorrelationResult(0, 1, 0, 0, 'none').to_dict()
+                    continue
+
+                # Align by bucket (both sides are sorted and unique)
+                _, es_idx, btc_idx = np.intersect1d(
+                    es_buckets, btc_buckets, assume_unique=True, return_indices=True
+                )
+
+                if len(es_idx) < 10:
+                    results[tf_name] = CorrelationResult(0, 1, 0, 0, 'none').to_dict()
+                    continue
+
+                result = calculate_correlation(es_closes[es_idx], btc_closes[btc_idx])
+                results[tf_name] = result.to_dict()
+
+            except Exception as e:
+                print(f"[ANALYSIS] Error calculating {tf_name} correlation: {e}")
+                results[tf_name] = CorrelationResult(0, 1, 0, 0, 'none').to_dict()
+
+        return results
+
 
 # Quick test
 if __name__ == '__main__':
@@ -4,9 +4,10 @@ Modular, compact, testable
 """
 
 import asyncio
+from collections import deque
 import json
 from datetime import datetime, timezone
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 from dataclasses import dataclass, field
 import pandas as pd
 import numpy as np
@@ -43,12 +44,14 @@ class OHLCV:
 class DataBuffer:
     """Thread-safe rolling buffer for OHLCV data"""
     max_bars: int = 500
-    bars: list = field(default_factory=list)
+    bars: deque = field(default_factory=deque)
+
+    def __post_init__(self):
+        # Bounded deque: append evicts the oldest bar in O(1)
+        self.bars = deque(self.bars, maxlen=self.max_bars)
 
     def add(self, bar: OHLCV):
         self.bars.append(bar)
-        if len(self.bars) > self.max_bars:
-            self.bars.pop(0)
 
     def to_dataframe(self) -> pd.DataFrame:
         if not self.bars:
@@ -67,6 +70,101 @@ class DataBuffer:
         return self.bars[-1] if self.bars else None
 
 
+class BarRing:
+    """
+    Fixed-capacity OHLCV ring stored as numpy columns (struct-of-arrays)
+
+    Appending past capacity overwrites the oldest slot in place, so eviction is
+    O(1) with no shifting; snapshots reorder at most once (see _ordered).
+    """
+
+    COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.ts = np.empty(capacity, dtype=np.int64)  # UTC epoch nanoseconds
+        self.cols = {name: np.empty(capacity, dtype=np.float64) for name in self.COLUMNS}
+        self.head = 0  # total bars ever appended; next write slot is head % capacity
+
+    def __len__(self) -> int:
+        return min(self.head, self.capacity)
+
+    def append(self, timestamp: datetime, open: float, high: float, low: float, close: float, volume: float):
+        self.append_ns(pd.Timestamp(timestamp).value, open, high, low, close, volume)
+
+    def append_ns(self, ts_ns: int, open: float, high: float, low: float, close: float, volume: float):
+        """append() with the timestamp already as UTC epoch nanoseconds"""
+        i = self.head % self.capacity
+        self.ts[i] = ts_ns
+        cols = self.cols
+        cols['open'][i] = open
+        cols['high'][i] = high
+        cols['low'][i] = low
+        cols['close'][i] = close
+        cols['volume'][i] = volume
+        self.head += 1
+
+    @property
+    def last_ts(self) -> Optional[int]:
+        """Timestamp (epoch ns) of the newest bar, or None when empty"""
+        if self.head == 0:
+            return None
+        return int(self.ts[(self.head - 1) % self.capacity])
+
+    def extend(self, ts_ns: np.ndarray, open: np.ndarray, high: np.ndarray,
+               low: np.ndarray, close: np.ndarray, volume: np.ndarray):
+        """Bulk append column arrays (oldest first) with one vectorized write per column"""
+        n = len(ts_ns)
+        if n == 0:
+            return
+        start = max(0, n - self.capacity)  # only the newest `capacity` rows survive
+        slots = (self.head + np.arange(start, n)) % self.capacity
+        self.ts[slots] = ts_ns[start:]
+        for name, values in zip(self.COLUMNS, (open, high, low, close, volume)):
+            self.cols[name][slots] = values[start:]
+        self.head += n
+
+    def _ordered(self, arr: np.ndarray) -> np.ndarray:
+        """Oldest-to-newest copy of a column (one slice copy unless wrapped)"""
+        if self.head <= self.capacity:
+            return arr[:self.head].copy()
+        split = self.head % self.capacity
+        return np.concatenate((arr[split:], arr[:split]))
+
+    def closes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Oldest-to-newest (timestamps, closes) snapshot - all the correlation needs"""
+        return self._ordered(self.ts), self._ordered(self.cols['close'])
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Snapshot as a DataFrame (timestamp + OHLCV); safe to hand to another thread"""
+        data = {'timestamp': pd.to_datetime(self._ordered(self.ts), utc=True)}
+        for name, arr in self.cols.items():
+            data[name] = self._ordered(arr)
+        return pd.DataFrame(data, copy=False)
+
+
+def _parse_closed_kline(msg: str) -> Optional[OHLCV]:
+    """Bar from a Binance kline frame, or None while the candle is still in progress
+
+    In-progress updates vastly outnumber closes, so frames without a JSON `true`
+    anywhere (the kline's only boolean is "x") skip the parse. The prefilter is
+    whitespace-agnostic, and the closed flag itself is read from the parsed frame.
+    """
+    if 'true' not in msg:
+        return None
+    k = json.loads(msg).get('k', {})
+    if k.get('x') is not True:
+        return None
+    return OHLCV(
+        timestamp=datetime.fromtimestamp(k['t'] / 1000, tz=timezone.utc),
+        open=float(k['o']),
+        high=float(k['h']),
+        low=float(k['l']),
+        close=float(k['c']),
+        volume=float(k['v'])
+    )
+
+
 class BinanceClient:
     """Binance WebSocket client for BTC/USDT"""
 
@@ -153,17 +251,8 @@ class BinanceClient:
                     async for msg in ws:
                         if not self._running:
                             break
-                        data = json.loads(msg)
-                        k = data.get('k', {})
-                        if k.get('x'):  # Candle closed
-                            bar = OHLCV(
-                                timestamp=datetime.fromtimestamp(k['t'] / 1000, tz=timezone.utc),
-                                open=float(k['o']),
-                                high=float(k['h']),
-                                low=float(k['l']),
-                                close=float(k['c']),
-                                volume=float(k['v'])
-                            )
+                        bar = _parse_closed_kline(msg)
+                        if bar is not None:
                             self.buffer.add(bar)
                             if self.on_bar:
                                 self.on_bar(bar)
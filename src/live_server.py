@@ -5,47 +5,145 @@ WITH correlation analysis and lead/lag detection
 """
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import os
 from datetime import datetime, timezone, timedelta
 import math
 from pathlib import Path
+import struct
 import time
+import zlib
 from aiohttp import web
 import aiohttp
+import numpy as np
 import pandas as pd
 
 # Use orjson for 10x faster JSON serialization
 try:
     import orjson
-    def json_dumps(data):
+    def json_dumps_bytes(data):
+        # UTF-8 bytes straight from orjson - no str round-trip before the socket
         # OPT_SERIALIZE_NUMPY handles numpy.float64, numpy.int64, etc.
-        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
-    def json_loads(data):
-        return orjson.loads(data)
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    json_loads = orjson.loads  # direct binding, no wrapper frame per call
     print("[PERF] Using orjson (10x faster) with numpy support")
 except ImportError:
     import json
-    def json_dumps(data):
-        return json.dumps(data)
-    def json_loads(data):
-        return json.loads(data)
+    def _numpy_default(obj):
+        # numpy scalars/arrays as builtins, mirroring orjson's OPT_SERIALIZE_NUMPY
+        if isinstance(obj, (np.generic, np.ndarray)):
+            return obj.tolist()
+        raise TypeError(f'{type(obj).__name__} is not JSON serializable')
+    def json_dumps_bytes(data):
+        # Compact separators, like orjson, so fallback frames aren't padded with spaces
+        return json.dumps(data, separators=(',', ':'), default=_numpy_default).encode('utf-8')
+    json_loads = json.loads
     print("[PERF] Using stdlib json (slower)")
 
 # Add parent to path for imports
 import sys
 sys.path.insert(0, str(Path(__file__).parent))
 
-from data_sources import BinanceClient, IBKRClient, OHLCV, DataBuffer
+from data_sources import BinanceClient, IBKRClient, OHLCV, DataBuffer, BarRing
 from analysis import calculate_correlation, MultiTimeframeAnalysis, CorrelationResult
 
 
+def _parse_binance_trade(msg: str) -> tuple:
+    """(price, trade_time_ms) from a Binance trade frame via string slicing (no JSON parse)
+
+    Falls back to a full JSON parse if the expected "p"/"T" fields aren't found.
+    """
+    try:
+        p = msg.index('"p":"') + 5
+        t = msg.index('"T":') + 4
+        t_end = msg.find(',', t)
+        return float(msg[p:msg.index('"', p)]), int(msg[t:t_end if t_end >= 0 else msg.index('}', t)])
+    except ValueError:
+        data = json_loads(msg)
+        return float(data['p']), int(data['T'])
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write `data` to `path` unless it already holds exactly those bytes
+
+    Skips the rewrite (and the file-watcher churn it causes) on unchanged restarts; a real
+    write goes through a temp file and os.replace so readers never see a partial page.
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass  # missing or unreadable: write it
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+
+def _html_etag(body: bytes) -> str:
+    """Strong ETag for a cached HTML page"""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+# Frames at least this large are deflated once server-side instead of per client
+DEFLATE_MIN_BYTES = 4096
+# Broadcasts compress on the hot path, so fastest level; the cached init/historical
+# snapshots are compressed once per data load and resent on every connect, so they
+# take the default level (~13% smaller than level 1 on a day of minute bars, ~10 ms once)
+BROADCAST_DEFLATE_LEVEL = 1
+SNAPSHOT_DEFLATE_LEVEL = 6
+
+
+def _deflate_frame(message: bytes, level: int = BROADCAST_DEFLATE_LEVEL) -> bytes:
+    """zlib-compress a large frame (browser inflates via DecompressionStream)"""
+    if len(message) < DEFLATE_MIN_BYTES:
+        return message
+    return zlib.compress(message, level)
+
+
+# Reply to the dashboard's 'ping' heartbeat; any inbound frame proves the socket is alive
+PONG_FRAME = b'{"type":"pong"}'
+
+
+# Tick batches go out as a binary frame rather than JSON:
+#   'T', 3 pad bytes, uint32 count n, float64[n] prices, float64[n] epoch-ms timestamps,
+#   uint8[n] symbol codes - little-endian, with the float64 columns 8-byte aligned so the
+#   browser can view them as typed arrays without copying or parsing.
+# Burst batches past DEFLATE_MIN_BYTES (~240 ticks) are deflated once for every client, like
+# any large frame: the near-identical timestamps compress ~4x, and level 1 costs ~45 us at that
+# size (level 6: ~120 us for ~13% less). Routine batches stay raw so the browser decodes them
+# synchronously instead of waiting on DecompressionStream
+TICK_FRAME_TAG = 0x54
+_TICK_FRAME_HEADER = struct.Struct('<BxxxI')
+
+
+def _pack_tick_frame(sym: np.ndarray, price: np.ndarray, ts_ms: np.ndarray) -> bytes:
+    """Binary tick frame from equal-length symbol/price/timestamp columns"""
+    return b''.join((
+        _TICK_FRAME_HEADER.pack(TICK_FRAME_TAG, len(price)),
+        price.astype('<f8', copy=False).tobytes(),
+        ts_ms.astype('<f8').tobytes(),
+        sym.astype(np.uint8).tobytes(),
+    ))
+
+
 class LiveDashboardServer:
     """WebSocket server that streams live data to browser with correlation analysis"""
 
+    # Frames buffered per client; when full the oldest queued frame is discarded
+    CLIENT_QUEUE_SIZE = 64
+    # Per-client cap on a single send before the client is dropped
+    BROADCAST_SEND_TIMEOUT = 1.0  # seconds
+    # Ticks arriving within this window go out as a single binary tick frame
+    TICK_BATCH_INTERVAL = 0.05  # 50ms
+    # Symbol codes used in tick frames (the dashboard's TICK_SYMBOLS mirrors this order)
+    TICK_SYMBOL_CODES = {'ES': 0, 'BTC': 1}
+
     def __init__(self, host='127.0.0.1', port=8765):
         self.host = host
         self.port = port
-        self.clients = set()
+        self.clients = {}  # WebSocketResponse -> outbound frame queue (drained by _client_writer)
         self.running = False
 
         # Data sources
@@ -59,9 +157,9 @@ class LiveDashboardServer:
         self.btc_backfill = []
 
         # Synchronized bar buffers for correlation (aligned by timestamp)
-        self.es_bar_buffer = []  # List of {timestamp, ohlcv}
-        self.btc_bar_buffer = []
         self.MAX_BUFFER_SIZE = 1500  # ~25 hours of 1-min data
+        self.es_bar_buffer = BarRing(self.MAX_BUFFER_SIZE)
+        self.btc_bar_buffer = BarRing(self.MAX_BUFFER_SIZE)
 
         # Latest prices for live tick updates (separate from bar data)
         self.latest_es_tick = None
@@ -74,12 +172,31 @@ class LiveDashboardServer:
         # Tick streaming
         self.btc_ws = None
 
+        # Completed bars waiting for the next loop turn, sent together as one 'bars' frame
+        self._pending_bars = []
+        self._bar_flush_scheduled = False
+
         # Correlation results cache
         self.latest_correlation = None
-
-        # Tick batching for high-frequency updates
-        self._tick_queue = []
-        self._tick_flush_task = None
+        self._init_payload = None  # serialized init frame, rebuilt after data changes
+        self._historical_payload = None  # serialized hourly-history frame, rebuilt after reloads
+        self._last_corr_minute = None  # newest minute both buffers had at the last recompute
+        # One dedicated worker: correlation runs queue behind each other instead of
+        # piling onto the default executor
+        self._corr_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='corr')
+        # Strong refs to fire-and-forget tasks (the loop only holds weak ones)
+        self._background_tasks = set()
+
+        # Tick batching for high-frequency updates: preallocated columns, no per-tick objects
+        self._tick_sym = np.empty(1024, dtype=np.int8)
+        self._tick_price = np.empty(1024, dtype=np.float64)
+        self._tick_ts = np.empty(1024, dtype=np.int64)
+        self._tick_n = 0
+
+        # Dashboard page rendered once and served from memory
+        reload_token = self._load_reload_token() or str(int(time.time()))
+        self._dashboard_html_bytes = _DASHBOARD_HTML.replace('__RELOAD_TOKEN__', reload_token).encode('utf-8')
+        self._dashboard_html_etag = _html_etag(self._dashboard_html_bytes)
 
     @staticmethod
     def _is_valid_price(value) -> bool:
@@ -98,7 +215,7 @@ class LiveDashboardServer:
         ]):
             return None
         return {
-            'time': int(self._align_timestamp(bar.timestamp).timestamp()),
+            'time': self._minute_epoch(bar.timestamp),
             'open': float(bar.open),
             'high': float(bar.high),
             'low': float(bar.low),
@@ -110,49 +227,153 @@ class LiveDashboardServer:
         """Remove non-finite rows before serialization"""
         if df is None or df.empty:
             return pd.DataFrame()
-        df = df.copy()
         numeric_cols = [c for c in ['open', 'high', 'low', 'close', 'volume'] if c in df.columns]
-        for col in numeric_cols:
-            df = df[pd.to_numeric(df[col], errors='coerce').apply(math.isfinite)]
-        df = df.dropna(subset=['timestamp'] + numeric_cols)
-        return df
+        # One vectorized isfinite over the whole numeric block; boolean indexing already
+        # returns a new frame, so no defensive copy
+        try:
+            values = df[numeric_cols].to_numpy(dtype=np.float64)
+        except (TypeError, ValueError):
+            # Stray non-numeric cells: coerce them to NaN so their rows drop
+            values = df[numeric_cols].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        keep = np.isfinite(values).all(axis=1) & df['timestamp'].notna().to_numpy()
+        return df[keep]
 
     async def _broadcast(self, data: dict):
-        """Send data to all connected clients (optimized)"""
+        """Queue data for all connected clients (each client's writer task does the send)"""
         if not self.clients:
             return
-        # Use orjson for faster serialization
-        message = json_dumps(data)
-        # Send to all clients, ignore errors
-        for client in list(self.clients):
-            try:
-                await client.send_str(message)
-            except:
-                pass  # Client disconnected
+        # Serialize (and deflate, if large) once; sent as binary frames (client decodes JSON).
+        # Only ticks are hot enough for a packed format; bar/correlation frames are small and
+        # once a minute, and init is deflated, so these stay JSON (no client-side codec needed)
+        self._broadcast_frame(_deflate_frame(json_dumps_bytes(data)))
+
+    def _broadcast_frame(self, message: bytes):
+        """Queue an already-encoded frame for all connected clients"""
+        for queue in self.clients.values():
+            # A client that can't keep up loses its oldest frames instead of
+            # holding up the producer or growing without bound
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
+    def _add_client(self, ws, *first_frames: bytes) -> asyncio.Task:
+        """Register a client with its outbound queue and start its writer task"""
+        queue = asyncio.Queue(maxsize=self.CLIENT_QUEUE_SIZE)
+        for frame in first_frames:
+            queue.put_nowait(frame)  # goes out ahead of any broadcast
+        self.clients[ws] = queue
+        return asyncio.create_task(self._client_writer(ws, queue))
+
+    def _send_pong(self, ws):
+        """Answer a client heartbeat through its queue (the writer task owns the socket)"""
+        queue = self.clients.get(ws)
+        # A full queue means frames are already flowing, which is heartbeat enough
+        if queue is not None and not queue.full():
+            queue.put_nowait(PONG_FRAME)
+
+    async def _client_writer(self, ws, queue: asyncio.Queue):
+        """Send queued frames to one client until it disconnects or stalls"""
+        try:
+            while True:
+                message = await queue.get()
+                # Frames that queued up during a send go out back to back, without
+                # suspending on the queue again between them
+                while message is not None:
+                    await asyncio.wait_for(ws.send_bytes(message), self.BROADCAST_SEND_TIMEOUT)
+                    message = queue.get_nowait() if not queue.empty() else None
+        except asyncio.TimeoutError:
+            self._drop_slow_client(ws)
+        except Exception:
+            self.clients.pop(ws, None)  # Client disconnected
+
+    def _drop_slow_client(self, ws):
+        """Disconnect a stalled client without awaiting its close handshake"""
+        self.clients.pop(ws, None)
+        print(f"[WS] Dropping slow client ({len(self.clients)} total)")
+        self._spawn(ws.close(code=aiohttp.WSCloseCode.INTERNAL_ERROR, message=b'Client too slow'))
+
+    def _spawn(self, coro):
+        """Run a coroutine in the background, kept alive until it finishes"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
 
     def _queue_tick(self, symbol: str, price: float, ts: int):
-        """Queue a tick for batched broadcast (reduces overhead)"""
+        """Queue a tick for batched broadcast (drained by _tick_drain_loop)"""
         if not self._is_valid_price(price):
             return
-        self._tick_queue.append({'s': symbol, 'p': price, 't': ts})
-
-        # Start flush task if not running
-        if self._tick_flush_task is None or self._tick_flush_task.done():
-            self._tick_flush_task = asyncio.create_task(self._flush_ticks())
-
-    async def _flush_ticks(self):
-        """Flush queued ticks every 8ms (~120fps) for smooth updates"""
-        await asyncio.sleep(0.008)  # Batch window: 8ms
-        if self._tick_queue:
-            ticks = self._tick_queue
-            self._tick_queue = []
-            await self._broadcast({'type': 'ticks', 'data': ticks})
-
-    def _align_timestamp(self, ts: datetime) -> datetime:
-        """Align timestamp to start of minute in UTC"""
+        n = self._tick_n
+        if n == len(self._tick_price):
+            # Burst outran the batch window - grow rather than drop ticks
+            self._tick_sym = np.resize(self._tick_sym, 2 * n)
+            self._tick_price = np.resize(self._tick_price, 2 * n)
+            self._tick_ts = np.resize(self._tick_ts, 2 * n)
+        self._tick_sym[n] = self.TICK_SYMBOL_CODES[symbol]
+        self._tick_price[n] = price
+        self._tick_ts[n] = ts
+        self._tick_n = n + 1
+
+    async def _tick_drain_loop(self):
+        """Flush queued ticks as one binary frame per batch window (single long-lived task)"""
+        while self.running:
+            await asyncio.sleep(self.TICK_BATCH_INTERVAL)
+            n = self._tick_n
+            if n:
+                self._tick_n = 0
+                if self.clients:
+                    self._broadcast_frame(_deflate_frame(_pack_tick_frame(
+                        self._tick_sym[:n], self._tick_price[:n], self._tick_ts[:n]
+                    )))
+
+    @staticmethod
+    def _epoch_seconds(timestamps: pd.Series) -> np.ndarray:
+        """UTC epoch seconds for a timestamp column (naive values are treated as UTC)"""
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps, utc=True)
+        # datetime64 storage is already UTC epoch ticks: one int64 floor-div, no tz conversion
+        return pd.DatetimeIndex(timestamps).as_unit('ns').asi8 // 1_000_000_000
+
+    @staticmethod
+    def _bars_from_columns(times: np.ndarray, cols: list) -> list:
+        """Chart bar dicts from epoch-second times and OHLCV column arrays (no iterrows)"""
+        return [
+            {'time': t, 'open': o, 'high': h, 'low': l, 'close': c, 'volume': v}
+            for t, o, h, l, c, v in zip(times.tolist(), *(col.tolist() for col in cols))
+        ]
+
+    @staticmethod
+    def _ohlcv_columns(df: pd.DataFrame) -> list:
+        """OHLCV columns of a cleaned frame as float64 arrays, in BarRing.COLUMNS order"""
+        return [df[col].to_numpy(dtype=np.float64) for col in BarRing.COLUMNS]
+
+    def _frame_to_bars(self, df: pd.DataFrame, align: bool = False) -> list:
+        """Chart bar dicts from a cleaned OHLCV frame"""
+        times = self._epoch_seconds(df['timestamp'])
+        if align:
+            times = times - times % 60
+        return self._bars_from_columns(times, self._ohlcv_columns(df))
+
+    def _ingest_minute_bars(self, ring: BarRing, df: pd.DataFrame, align: bool = False) -> list:
+        """
+        Chart bars for a cleaned 1-min frame, also blitted into a correlation ring
+
+        The ring always gets minute-aligned timestamps; one timestamp conversion and
+        one column extraction serve both outputs.
+        """
+        secs = self._epoch_seconds(df['timestamp'])
+        minutes = secs - secs % 60
+        cols = self._ohlcv_columns(df)
+        ring.extend(minutes * 1_000_000_000, *cols)
+        return self._bars_from_columns(minutes if align else secs, cols)
+
+    @staticmethod
+    def _minute_epoch(ts: datetime) -> int:
+        """UTC epoch seconds of the minute containing `ts` (naive values are treated as UTC)"""
         if ts.tzinfo is None:
             ts = ts.replace(tzinfo=timezone.utc)
-        return ts.replace(second=0, microsecond=0)
+        secs = int(ts.timestamp())
+        return secs - secs % 60
 
     def _on_es_bar(self, bar: OHLCV):
         """Callback when new ES bar completes"""
@@ -161,28 +382,15 @@ class LiveDashboardServer:
             print("[ES] Skipping invalid bar")
             return
         self.latest_es_bar = bar
-        aligned_ts = self._align_timestamp(bar.timestamp)
-
-        # Store in synchronized buffer
-        self.es_bar_buffer.append({
-            'timestamp': aligned_ts,
-            'open': bar.open, 'high': bar.high,
-            'low': bar.low, 'close': bar.close,
-            'volume': bar.volume
-        })
-        if len(self.es_bar_buffer) > self.MAX_BUFFER_SIZE:
-            self.es_bar_buffer.pop(0)
-
-        # Broadcast bar update
-        asyncio.create_task(self._broadcast({
-            'type': 'bar',
-            'symbol': 'ES',
-            'data': payload
-        }))
+
+        # Store in synchronized buffer, at the minute already computed for the payload
+        self.es_bar_buffer.append_ns(payload['time'] * 1_000_000_000, payload['open'], payload['high'],
+                                      payload['low'], payload['close'], payload['volume'])
+
         print(f"[ES] {bar.timestamp.strftime('%H:%M:%S')} Close: {bar.close:.2f}")
 
-        # Trigger correlation calculation after each bar
-        asyncio.create_task(self._calculate_and_broadcast_correlation())
+        # Broadcast with any bar closing in the same loop turn, plus the correlation it triggers
+        self._queue_bar('ES', payload)
 
     def _on_btc_bar(self, bar: OHLCV):
         """Callback when new BTC bar completes"""
@@ -191,51 +399,44 @@ class LiveDashboardServer:
             print("[BTC] Skipping invalid bar")
             return
         self.latest_btc_bar = bar
-        aligned_ts = self._align_timestamp(bar.timestamp)
-
-        # Store in synchronized buffer
-        self.btc_bar_buffer.append({
-            'timestamp': aligned_ts,
-            'open': bar.open, 'high': bar.high,
-            'low': bar.low, 'close': bar.close,
-            'volume': bar.volume
-        })
-        if len(self.btc_bar_buffer) > self.MAX_BUFFER_SIZE:
-            self.btc_bar_buffer.pop(0)
-
-        # Broadcast bar update
-        asyncio.create_task(self._broadcast({
-            'type': 'bar',
-            'symbol': 'BTC',
-            'data': payload
-        }))
+
+        # Store in synchronized buffer, at the minute already computed for the payload
+        self.btc_bar_buffer.append_ns(payload['time'] * 1_000_000_000, payload['open'], payload['high'],
+                                       payload['low'], payload['close'], payload['volume'])
+
         print(f"[BTC] {bar.timestamp.strftime('%H:%M:%S')} Close: {bar.close:.2f}")
 
-        # Trigger correlation calculation after each bar
-        asyncio.create_task(self._calculate_and_broadcast_correlation())
+        # Broadcast with any bar closing in the same loop turn, plus the correlation it triggers
+        self._queue_bar('BTC', payload)
 
-    async def _calculate_and_broadcast_correlation(self):
-        """Calculate multi-timeframe correlation and broadcast to clients"""
+    @staticmethod
+    def _compute_correlation(es_ts: np.ndarray, es_close: np.ndarray,
+                             btc_ts: np.ndarray, btc_close: np.ndarray) -> dict:
+        """Run multi-timeframe analysis on close snapshots (CPU-bound, off the event loop)"""
+        return MultiTimeframeAnalysis.from_arrays(es_ts, es_close, btc_ts, btc_close).analyze_all()
+
+    async def _update_correlation(self) -> dict | None:
+        """Recalculate multi-timeframe correlation and cache it (None if not enough data)"""
         try:
             # Need at least 20 bars to calculate meaningful correlation
             if len(self.es_bar_buffer) < 20 or len(self.btc_bar_buffer) < 20:
-                return
+                return None
 
-            # Convert to DataFrames
-            es_df = pd.DataFrame(self.es_bar_buffer)
-            btc_df = pd.DataFrame(self.btc_bar_buffer)
+            # Bars only line up on shared minutes, so nothing changes until the
+            # lagging side catches up - skip the rerun for the side that is ahead
+            minute = min(self.es_bar_buffer.last_ts, self.btc_bar_buffer.last_ts)
+            if minute == self._last_corr_minute:
+                return None
+            self._last_corr_minute = minute
 
-            # Run multi-timeframe analysis
-            analyzer = MultiTimeframeAnalysis(es_df, btc_df)
-            results = analyzer.analyze_all()
+            # Analysis runs on the correlation worker with close-column snapshots so ticks keep flowing
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._corr_pool, self._compute_correlation,
+                *self.es_bar_buffer.closes(), *self.btc_bar_buffer.closes()
+            )
 
             self.latest_correlation = results
-
-            # Broadcast to all clients
-            await self._broadcast({
-                'type': 'correlation',
-                'data': results
-            })
+            self._init_payload = None
 
             # Log lead/lag info
             if '1m' in results and results['1m']['lead_lag'] != 0:
@@ -243,9 +444,41 @@ class LiveDashboardServer:
                 lag = abs(results['1m']['lead_lag'])
                 corr = results['1m']['correlation']
                 print(f"[CORR] {leader} leads by {lag} bar(s), r={corr:.3f}")
+            return results
 
         except Exception as e:
             print(f"[CORR] Error calculating correlation: {e}")
+            self._last_corr_minute = None  # allow a retry on the next bar
+            return None
+
+    async def _calculate_and_broadcast_correlation(self):
+        """Calculate multi-timeframe correlation and broadcast to clients"""
+        results = await self._update_correlation()
+        if results is not None:
+            await self._broadcast({
+                'type': 'correlation',
+                'data': results
+            })
+
+    def _queue_bar(self, symbol: str, payload: dict):
+        """Queue a completed bar; one publish task per loop turn picks up all queued bars"""
+        self._pending_bars.append({'symbol': symbol, 'bar': payload})
+        if not self._bar_flush_scheduled:
+            self._bar_flush_scheduled = True
+            self._spawn(self._publish_bars())
+
+    async def _publish_bars(self):
+        """Broadcast queued bars and the correlation they trigger as a single frame"""
+        await asyncio.sleep(0)  # let the other venue's bar closing in the same turn join
+        bars = self._pending_bars
+        self._pending_bars = []
+        self._bar_flush_scheduled = False
+
+        frame = {'type': 'bars', 'data': bars}
+        results = await self._update_correlation()
+        if results is not None:
+            frame['correlation'] = results
+        await self._broadcast(frame)
 
     async def _fetch_backfill(self):
         """Fetch last 24h of 1-min data for both assets"""
@@ -256,22 +489,8 @@ class LiveDashboardServer:
             btc_df = await self.binance.fetch_historical('1m', 1440)
             btc_df = self._clean_dataframe(btc_df)
             if not btc_df.empty:
-                self.btc_backfill = [
-                    {'time': int(row['timestamp'].timestamp()),
-                     'open': row['open'], 'high': row['high'],
-                     'low': row['low'], 'close': row['close'],
-                     'volume': row['volume']}
-                    for _, row in btc_df.iterrows()
-                ]
-                # Also populate the synchronized buffer
-                for _, row in btc_df.iterrows():
-                    aligned_ts = self._align_timestamp(row['timestamp'])
-                    self.btc_bar_buffer.append({
-                        'timestamp': aligned_ts,
-                        'open': row['open'], 'high': row['high'],
-                        'low': row['low'], 'close': row['close'],
-                        'volume': row['volume']
-                    })
+                # Chart bars, plus the synchronized buffer
+                self.btc_backfill = self._ingest_minute_bars(self.btc_bar_buffer, btc_df)
                 print(f"[BTC] Backfill: {len(self.btc_backfill)} bars")
         except Exception as e:
             print(f"[BTC] Backfill error: {e}")
@@ -281,22 +500,8 @@ class LiveDashboardServer:
             es_df = self.ibkr.fetch_historical('3 D', '1 min')  # 3 trading days of 1-min bars
             es_df = self._clean_dataframe(es_df)
             if es_df is not None and not es_df.empty:
-                self.es_backfill = [
-                    {'time': int(row['timestamp'].timestamp()),
-                     'open': row['open'], 'high': row['high'],
-                     'low': row['low'], 'close': row['close'],
-                     'volume': row['volume']}
-                    for _, row in es_df.iterrows()
-                ]
-                # Also populate the synchronized buffer
-                for _, row in es_df.iterrows():
-                    aligned_ts = self._align_timestamp(row['timestamp'])
-                    self.es_bar_buffer.append({
-                        'timestamp': aligned_ts,
-                        'open': row['open'], 'high': row['high'],
-                        'low': row['low'], 'close': row['close'],
-                        'volume': row['volume']
-                    })
+                # Chart bars, plus the synchronized buffer
+                self.es_backfill = self._ingest_minute_bars(self.es_bar_buffer, es_df)
                 print(f"[ES] Backfill: {len(self.es_backfill)} bars")
         except Exception as e:
             print(f"[ES] Backfill error: {e}")
@@ -307,13 +512,7 @@ class LiveDashboardServer:
             btc_hist = await self.binance.fetch_historical('1h', 168)
             btc_hist = self._clean_dataframe(btc_hist)
             if not btc_hist.empty:
-                self.btc_historical = [
-                    {'time': int(row['timestamp'].timestamp()),
-                     'open': row['open'], 'high': row['high'],
-                     'low': row['low'], 'close': row['close'],
-                     'volume': row['volume']}
-                    for _, row in btc_hist.iterrows()
-                ]
+                self.btc_historical = self._frame_to_bars(btc_hist)
                 print(f"[BTC] Historical: {len(self.btc_historical)} bars")
         except Exception as e:
             print(f"[BTC] Historical error: {e}")
@@ -337,23 +536,9 @@ class LiveDashboardServer:
                     btc_df = self._clean_dataframe(btc_df)
                     if not btc_df.empty:
                         btc_df = btc_df[btc_df['timestamp'] > last_btc_ts]
-                        new_bars = [
-                            {'time': int(row['timestamp'].timestamp()),
-                             'open': row['open'], 'high': row['high'],
-                             'low': row['low'], 'close': row['close'],
-                             'volume': row['volume']}
-                            for _, row in btc_df.iterrows()
-                        ]
+                        new_bars = self._ingest_minute_bars(self.btc_bar_buffer, btc_df)
                         if new_bars:
                             self.btc_backfill.extend(new_bars)
-                            for bar in new_bars:
-                                aligned_ts = self._align_timestamp(datetime.fromtimestamp(bar['time'], tz=timezone.utc))
-                                self.btc_bar_buffer.append({
-                                    'timestamp': aligned_ts,
-                                    'open': bar['open'], 'high': bar['high'],
-                                    'low': bar['low'], 'close': bar['close'],
-                                    'volume': bar['volume']
-                                })
                             print(f"[GAP][BTC] Filled {len(new_bars)} missing bars")
 
             # ES gaps (1m)
@@ -366,23 +551,9 @@ class LiveDashboardServer:
                     es_df = self._clean_dataframe(es_df)
                     if not es_df.empty:
                         es_df = es_df[es_df['timestamp'] > last_es_ts]
-                        new_bars = [
-                            {'time': int(self._align_timestamp(row['timestamp']).timestamp()),
-                             'open': row['open'], 'high': row['high'],
-                             'low': row['low'], 'close': row['close'],
-                             'volume': row['volume']}
-                            for _, row in es_df.iterrows()
-                        ]
+                        new_bars = self._ingest_minute_bars(self.es_bar_buffer, es_df, align=True)
                         if new_bars:
                             self.es_backfill.extend(new_bars)
-                            for bar in new_bars:
-                                aligned_ts = datetime.fromtimestamp(bar['time'], tz=timezone.utc)
-                                self.es_bar_buffer.append({
-                                    'timestamp': aligned_ts,
-                                    'open': bar['open'], 'high': bar['high'],
-                                    'low': bar['low'], 'close': bar['close'],
-                                    'volume': bar['volume']
-                                })
                             print(f"[GAP][ES] Filled {len(new_bars)} missing bars")
 
         except Exception as e:
@@ -392,70 +563,91 @@ class LiveDashboardServer:
             es_hist = self.ibkr.fetch_historical('7 D', '1 hour')
             es_hist = self._clean_dataframe(es_hist)
             if es_hist is not None and not es_hist.empty:
-                self.es_historical = [
-                    {'time': int(row['timestamp'].timestamp()),
-                     'open': row['open'], 'high': row['high'],
-                     'low': row['low'], 'close': row['close'],
-                     'volume': row['volume']}
-                    for _, row in es_hist.iterrows()
-                ]
+                self.es_historical = self._frame_to_bars(es_hist)
                 print(f"[ES] Historical: {len(self.es_historical)} bars")
         except Exception as e:
             print(f"[ES] Historical error: {e}")
 
+        # Backfill/historical lists changed - re-serialize init on next connect
+        self._init_payload = None
+        self._historical_payload = None
+        self._last_corr_minute = None
+
         # Calculate initial correlation from backfill data
         await self._calculate_and_broadcast_correlation()
 
+    def _get_init_payload(self) -> bytes:
+        """Init frame bytes, serialized once and shared by every connecting client
+
+        Carries what the realtime and overlay charts need; the hourly history follows in
+        its own frame (_get_historical_payload) so the client can paint before parsing it.
+        """
+        if self._init_payload is None:
+            init_data = {
+                'type': 'init',
+                'es_backfill': self.es_backfill,
+                'btc_backfill': self.btc_backfill,
+                'es_contract': self.ibkr.contract_symbol
+            }
+
+            # Include latest correlation if available
+            if self.latest_correlation:
+                init_data['correlation'] = self.latest_correlation
+
+            self._init_payload = _deflate_frame(json_dumps_bytes(init_data), SNAPSHOT_DEFLATE_LEVEL)
+        return self._init_payload
+
+    def _get_historical_payload(self) -> bytes:
+        """Hourly-history frame bytes, sent right after init and shared like it"""
+        if self._historical_payload is None:
+            self._historical_payload = _deflate_frame(json_dumps_bytes({
+                'type': 'historical',
+                'es_historical': self.es_historical,
+                'btc_historical': self.btc_historical,
+            }), SNAPSHOT_DEFLATE_LEVEL)
+        return self._historical_payload
+
     async def websocket_handler(self, request):
         """Handle WebSocket connections"""
-        ws = web.WebSocketResponse()
+        # No permessage-deflate (aiohttp negotiates it unless compress=False): large frames
+        # are deflated once in _deflate_frame rather than re-compressed for every client
+        ws = web.WebSocketResponse(compress=False)
         await ws.prepare(request)
 
-        self.clients.add(ws)
+        # Initial data leads the client's queue: realtime backfill first, hourly history next
+        writer = self._add_client(ws, self._get_init_payload(), self._get_historical_payload())
         print(f"[WS] Client connected ({len(self.clients)} total)")
 
-        # Send initial data
-        init_data = {
-            'type': 'init',
-            'es_backfill': self.es_backfill,
-            'btc_backfill': self.btc_backfill,
-            'es_historical': self.es_historical,
-            'btc_historical': self.btc_historical,
-            'es_contract': self.ibkr.contract_symbol
-        }
-
-        # Include latest correlation if available
-        if self.latest_correlation:
-            init_data['correlation'] = self.latest_correlation
-
-        await ws.send_json(init_data)
-
         try:
             async for msg in ws:
                 if msg.type == aiohttp.WSMsgType.TEXT:
-                    # Handle client messages if needed
-                    pass
+                    if msg.data == 'ping':
+                        self._send_pong(ws)
                 elif msg.type == aiohttp.WSMsgType.ERROR:
                     print(f"[WS] Error: {ws.exception()}")
         finally:
-            self.clients.discard(ws)
+            writer.cancel()
+            self.clients.pop(ws, None)
             print(f"[WS] Client disconnected ({len(self.clients)} total)")
 
         return ws
 
+    @staticmethod
+    def _html_response(request, body: bytes, etag: str):
+        """Serve cached HTML with an ETag; 304 when the browser already has it"""
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if_none_match = request.headers.get('If-None-Match', '')
+        if if_none_match == '*' or etag in (tag.strip() for tag in if_none_match.split(',')):
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type='text/html', charset='utf-8', headers=headers)
+
     async def index_handler(self, request):
-        """Serve the dashboard HTML"""
-        html_path = Path(__file__).parent.parent / 'output' / 'live_dashboard.html'
-        if html_path.exists():
-            return web.FileResponse(html_path)
-        return web.Response(text="Dashboard not found", status=404)
+        """Serve the dashboard HTML (from memory, no per-request file I/O)"""
+        return self._html_response(request, self._dashboard_html_bytes, self._dashboard_html_etag)
 
     async def micro_handler(self, request):
         """Serve the micro-view dashboard HTML"""
-        html_path = Path(__file__).parent.parent / 'output' / 'micro_dashboard.html'
-        if html_path.exists():
-            return web.FileResponse(html_path)
-        return web.Response(text="Micro dashboard not found", status=404)
+        return self._html_response(request, _MICRO_HTML_BYTES, _MICRO_HTML_ETAG)
 
     def _run_ibkr_stream(self):
         """Run IBKR stream in thread"""
@@ -474,9 +666,7 @@ class LiveDashboardServer:
                     async for msg in ws:
                         if not self.running:
                             break
-                        data = json_loads(msg)
-                        price = float(data['p'])
-                        ts = int(data['T'])  # Trade timestamp from Binance
+                        price, ts = _parse_binance_trade(msg)  # ts: Binance trade time (ms)
 
                         # Only queue if price changed (reduces noise)
                         if self._is_valid_price(price) and price != last_price:
@@ -515,7 +705,7 @@ class LiveDashboardServer:
             # Only queue if price changed
             if price is not None and self._is_valid_price(price) and price != last_price[0]:
                 self.latest_es_tick = price
-                ts = int(asyncio.get_event_loop().time() * 1000)
+                ts = time.time_ns() // 1_000_000  # wall-clock ms, comparable to Date.now() in the browser
                 self._queue_tick('ES', price, ts)
                 last_price[0] = price
 
@@ -594,6 +784,9 @@ class LiveDashboardServer:
         # Periodic correlation update
         corr_task = asyncio.create_task(self._periodic_correlation_update())
 
+        # Batched tick broadcast
+        tick_drain_task = asyncio.create_task(self._tick_drain_loop())
+
         # Open browser
         import webbrowser
         webbrowser.open(f'http://{self.host}:{self.port}')
@@ -611,6 +804,8 @@ class LiveDashboardServer:
             btc_tick_task.cancel()
             es_tick_task.cancel()
             corr_task.cancel()
+            tick_drain_task.cancel()
+            self._corr_pool.shutdown(wait=False, cancel_futures=True)
             await runner.cleanup()
             print("[OK] Shutdown complete")
 
@@ -629,13 +824,32 @@ class LiveDashboardServer:
         return web.Response(text=token or '', headers={'Cache-Control': 'no-store'})
 
     def _generate_live_html(self):
-        """Generate the live WebSocket-powered dashboard with correlation analysis"""
-        reload_token = self._load_reload_token() or str(int(time.time()))
-        html = '''<!DOCTYPE html>
+        """Write the live WebSocket-powered dashboard with correlation analysis"""
+        output_dir = Path(__file__).parent.parent / 'output'
+        output_dir.mkdir(exist_ok=True)
+
+        if _write_if_changed(output_dir / 'live_dashboard.html', self._dashboard_html_bytes):
+            print(f"[OK] Generated live dashboard")
+
+    def _generate_micro_html(self):
+        """Write a slim microstructure-focused dashboard (remove historical panes)."""
+        output_dir = Path(__file__).parent.parent / 'output'
+        output_dir.mkdir(exist_ok=True)
+
+        if _write_if_changed(output_dir / 'micro_dashboard.html', _MICRO_HTML_BYTES):
+            print(f"[OK] Generated micro dashboard")
+
+
+# Live dashboard page; __RELOAD_TOKEN__ is substituted once per server instance
+_DASHBOARD_HTML = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>ES/BTC Live Correlation Dashboard</title>
+    <!-- Pinned upstream build: Lightweight Charts 4.x only ships the Canvas2D renderer (no
+         WebGL option) and builds its own DOM, so it cannot draw into an OffscreenCanvas from a
+         Worker; paint cost is kept down by frame-batched, incremental series updates (the
+         hourly charts repaint at most every HOURLY_REPAINT_MS) -->
     <script src="https://unpkg.com/lightweight-charts@4.1.0/dist/lightweight-charts.standalone.production.js"></script>
     <style>
         * { margin: 0; padding: 0; box-sizing: border-box; }
@@ -1093,7 +1307,9 @@ class LiveDashboardServer:
                 <div id="es-price-label" style="
                     position: absolute;
                     right: 5px;
-                    top: 100px;
+                    top: 0;
+                    transform: translate3d(0, 100px, 0);
+                    will-change: transform;
                     background: #2962FF;
                     color: white;
                     padding: 4px 10px;
@@ -1128,33 +1344,30 @@ class LiveDashboardServer:
             _throttleMap.set(key, now);
             try { fn(); } catch (e) { chartWarn('throttled op failed', { key, error: e?.message }); }
         }
-        // Suppress noisy LWC "Value is null" errors from both window errors and console
-        (function() {
-            const originalError = console.error;
-            console.error = function(...args) {
-                const msg = args.join(' ');
-                if (msg.includes('Value is null') || msg.includes('lightweight-charts')) return;
-                originalError.apply(console, args);
+        // Leading+trailing throttle: first call runs now, bursts collapse into one trailing call
+        function throttle(fn, delayMs) {
+            let last = 0;
+            let timer = null;
+            return function throttled() {
+                const wait = delayMs - (Date.now() - last);
+                if (wait <= 0) {
+                    if (timer) { clearTimeout(timer); timer = null; }
+                    last = Date.now();
+                    fn();
+                } else if (!timer) {
+                    timer = setTimeout(() => {
+                        timer = null;
+                        last = Date.now();
+                        fn();
+                    }, wait);
+                }
             };
-        })();
-        window.addEventListener('error', function(e) {
-            if (e && e.message && (e.message.includes('Value is null') || e.message.includes('lightweight-charts'))) {
-                e.preventDefault();
-                e.stopPropagation();
-                return true;
-            }
-        }, true);
-        window.addEventListener('unhandledrejection', function(e) {
-            if (e.reason && String(e.reason).includes('Value is null')) {
-                e.preventDefault();
-                return true;
-            }
-        });
+        }
         // Session anchor modes for ES % base
         const ANCHOR_MODES = { GLOBEX: 'globex', CASH: 'cash' };
 
         // --- Dev live-reload hook (polls reload token and refreshes on change) ---
-        const RELOAD_TOKEN = ''' + f"'{reload_token}'" + ''';
+        const RELOAD_TOKEN = '__RELOAD_TOKEN__';
         setInterval(async () => {
             try {
                 const res = await fetch('/reload-token', { cache: 'no-store' });
@@ -1176,12 +1389,14 @@ class LiveDashboardServer:
                    isFinite(range.from) && isFinite(range.to) && range.from < range.to;
         }
 
-        // Interaction lock to detect wheel / touch / pinch / scroll gestures
+        // Interaction lock to detect wheel / touch / pinch / scroll gestures over a chart
+        // (mousedown is deliberately not included - it would block measurement clicks)
         function createInteractionLock(debounceMs = 300) {
             let active = false;
             let timer = null;
 
-            function activate() {
+            function activate(e) {
+                if (!e.target.closest?.('.chart-wrapper')) return;  // page scroll elsewhere
                 active = true;
                 if (timer) clearTimeout(timer);
                 timer = setTimeout(() => { active = false; }, debounceMs);
@@ -1194,8 +1409,16 @@ class LiveDashboardServer:
             return () => active;
         }
 
+        // Recursively freeze a static options tree so it can be shared safely between charts
+        function deepFreeze(obj) {
+            for (const value of Object.values(obj)) {
+                if (value && typeof value === 'object') deepFreeze(value);
+            }
+            return Object.freeze(obj);
+        }
+
         // Chart setup with full navigation
-        const chartOptions = {
+        const chartOptions = deepFreeze({
             layout: { background: { type: 'solid', color: '#0a0a0f' }, textColor: '#787b86' },
             grid: { vertLines: { color: '#1a1a2e' }, horzLines: { color: '#1a1a2e' } },
             crosshair: { mode: LightweightCharts.CrosshairMode.Normal },
@@ -1209,12 +1432,41 @@ class LiveDashboardServer:
             },
             handleScroll: { mouseWheel: true, pressedMouseMove: true, horzTouchDrag: true, vertTouchDrag: true },
             handleScale: { axisPressedMouseMove: true, mouseWheel: true, pinch: true }
-        };
+        });
+
+        // Overlay charts only override a few top-level sections of the shared base
+        const overlayChartOptions = deepFreeze({
+            rightPriceScale: {
+                borderColor: '#2a2a3e',
+                scaleMargins: { top: 0.05, bottom: 0.15 },
+                visible: true
+            },
+            leftPriceScale: {
+                borderColor: '#2a2a3e',
+                scaleMargins: { top: 0.05, bottom: 0.15 },
+                visible: true
+            }
+        });
+        const overlayVolChartOptions = deepFreeze({
+            rightPriceScale: { visible: true, scaleMargins: { top: 0.1, bottom: 0 } },
+            leftPriceScale: { visible: false },
+            timeScale: {
+                visible: false,
+                rightOffset: 5,
+                barSpacing: 6,
+                minBarSpacing: 3
+            }
+        });
+
+        // Per-chart options: frozen base (+ overrides) with only the size delta added
+        function sizedChartOptions(width, height, overrides) {
+            return Object.assign({}, chartOptions, overrides, { width, height });
+        }
 
         // Global interaction guard used by sync logic
         const isUserInteracting = createInteractionLock(400);
         function isAnyInteraction() {
-            return isDragging || overlayDragging || isUserInteracting();
+            return overlayDragging || isUserInteracting();
         }
 
         // === Session anchor helpers (ES % base) ===
@@ -1245,97 +1497,135 @@ class LiveDashboardServer:
             return Math.floor(anchorUtcMs / 1000);
         }
 
+        // Close of the first bar at/after the anchor (RingBuf: scans the time column)
         function findBasePrice(dataArray, anchorSeconds) {
             if (!dataArray || dataArray.length === 0) return null;
-            let base = dataArray[0].close;
-            if (!anchorSeconds) return base;
-            for (const d of dataArray) {
-                if (d.time >= anchorSeconds) {
-                    base = d.close;
-                    break;
-                }
+            if (!anchorSeconds) return dataArray.closeAt(0);
+            for (let i = 0; i < dataArray.length; i++) {
+                if (dataArray.timeAt(i) >= anchorSeconds) return dataArray.closeAt(i);
+            }
+            return dataArray.closeAt(0);
+        }
+
+        // Cached DOM refs for per-tick/per-bar/resize paths (looked up once)
+        const dom = {
+            esRealtime: document.getElementById('es-realtime'),
+            btcRealtime: document.getElementById('btc-realtime'),
+            esHistorical: document.getElementById('es-historical'),
+            btcHistorical: document.getElementById('btc-historical'),
+            esContract: document.getElementById('es-contract'),
+            esPrice: document.getElementById('es-price'),
+            btcPrice: document.getElementById('btc-price'),
+            esPct: document.getElementById('es-pct'),
+            btcPct: document.getElementById('btc-pct'),
+            esPriceLabel: document.getElementById('es-price-label'),
+            overlayBtcPrice: document.getElementById('overlay-btc-price'),
+            overlayBtcPct: document.getElementById('overlay-btc-pct'),
+            overlayEsPrice: document.getElementById('overlay-es-price'),
+            overlayEsPct: document.getElementById('overlay-es-pct'),
+            btcRate: document.getElementById('btc-rate'),
+            latency: document.getElementById('latency-display'),
+            corr: {
+                '1m': document.getElementById('corr-1m'),
+                '5m': document.getElementById('corr-5m'),
+                '15m': document.getElementById('corr-15m'),
+                '1h': document.getElementById('corr-1h'),
+            },
+            leadLag: document.getElementById('lead-lag-value'),
+            signal: document.getElementById('trading-signal'),
+            signalBox: document.getElementById('signal-box'),
+            statusDot: document.getElementById('status-dot'),
+            anchorGlobex: document.getElementById('anchor-globex'),
+            anchorCash: document.getElementById('anchor-cash'),
+        };
+
+        // Memoized DOM writes: touch a node only when the rendered value changes
+        function setText(el, text) {
+            if (el && el._lastText !== text) {
+                el.textContent = text;
+                el._lastText = text;
+            }
+        }
+        function setColor(el, color) {
+            if (el && el._lastColor !== color) {
+                el.style.color = color;
+                el._lastColor = color;
+            }
+        }
+        function setClassName(el, name) {
+            if (el && el._lastClass !== name) {
+                el.className = name;
+                el._lastClass = name;
             }
-            return base;
+        }
+        // Two-decimal displays compare in hundredths (plus sign) before building any string,
+        // so a value that still renders the same costs no toFixed/concat
+        function hundredthsChanged(el, value) {
+            const hundredths = Math.round(value * 100);
+            const up = value >= 0;
+            if (el._lastHundredths === hundredths && el._lastUp === up) return false;
+            el._lastHundredths = hundredths;
+            el._lastUp = up;
+            return true;
+        }
+        function setFixed2(el, value) {
+            if (el && hundredthsChanged(el, value)) setText(el, value.toFixed(2));
+        }
+        // Signed 2dp percent label; callers gate it on hundredthsChanged, so it only
+        // runs when the displayed value actually moves
+        function signedPct(pct, up) {
+            return (up ? '+' : '') + pct.toFixed(2) + '%';
+        }
+        function setPctText(el, pct) {
+            if (!el || !hundredthsChanged(el, pct)) return;
+            const up = pct >= 0;
+            setText(el, signedPct(pct, up));
+            setColor(el, up ? '#26a69a' : '#ef5350');
         }
 
         // Create charts
-        const esRtChart = LightweightCharts.createChart(document.getElementById('es-realtime'),
-            { ...chartOptions, width: document.getElementById('es-realtime').offsetWidth, height: 280 });
-        const btcRtChart = LightweightCharts.createChart(document.getElementById('btc-realtime'),
-            { ...chartOptions, width: document.getElementById('btc-realtime').offsetWidth, height: 280 });
-        const esHistChart = LightweightCharts.createChart(document.getElementById('es-historical'),
-            { ...chartOptions, width: document.getElementById('es-historical').offsetWidth, height: 240 });
-        const btcHistChart = LightweightCharts.createChart(document.getElementById('btc-historical'),
-            { ...chartOptions, width: document.getElementById('btc-historical').offsetWidth, height: 240 });
+        const esRtChart = LightweightCharts.createChart(dom.esRealtime,
+            sizedChartOptions(dom.esRealtime.offsetWidth, 280));
+        const btcRtChart = LightweightCharts.createChart(dom.btcRealtime,
+            sizedChartOptions(dom.btcRealtime.offsetWidth, 280));
+        const esHistChart = LightweightCharts.createChart(dom.esHistorical,
+            sizedChartOptions(dom.esHistorical.offsetWidth, 240));
+        const btcHistChart = LightweightCharts.createChart(dom.btcHistorical,
+            sizedChartOptions(dom.btcHistorical.offsetWidth, 240));
 
         // Candlestick series - ES (teal/green), BTC (blue - changed from orange!)
-        const esRtSeries = esRtChart.addCandlestickSeries({
-            upColor: '#26a69a', downColor: '#ef5350',
-            borderUpColor: '#26a69a', borderDownColor: '#ef5350',
-            wickUpColor: '#26a69a', wickDownColor: '#ef5350'
-        });
-        const btcRtSeries = btcRtChart.addCandlestickSeries({
-            upColor: '#42A5F5', downColor: '#EF5350',
-            borderUpColor: '#42A5F5', borderDownColor: '#EF5350',
-            wickUpColor: '#42A5F5', wickDownColor: '#EF5350'
-        });
-        const esHistSeries = esHistChart.addCandlestickSeries({
+        // One frozen color set per palette, shared by every series that uses it
+        const CANDLE_TEAL = Object.freeze({
             upColor: '#26a69a', downColor: '#ef5350',
             borderUpColor: '#26a69a', borderDownColor: '#ef5350',
             wickUpColor: '#26a69a', wickDownColor: '#ef5350'
         });
-        const btcHistSeries = btcHistChart.addCandlestickSeries({
+        const CANDLE_BLUE = Object.freeze({
             upColor: '#42A5F5', downColor: '#EF5350',
             borderUpColor: '#42A5F5', borderDownColor: '#EF5350',
             wickUpColor: '#42A5F5', wickDownColor: '#EF5350'
         });
+        const esRtSeries = esRtChart.addCandlestickSeries(CANDLE_TEAL);
+        const btcRtSeries = btcRtChart.addCandlestickSeries(CANDLE_BLUE);
+        const esHistSeries = esHistChart.addCandlestickSeries(CANDLE_TEAL);
+        const btcHistSeries = btcHistChart.addCandlestickSeries(CANDLE_BLUE);
 
         // ========== TradingView-Style Overlay Chart ==========
         const overlayChartEl = document.getElementById('overlay-main-chart');
         const overlayVolChartEl = document.getElementById('overlay-volume-chart');
 
-        const overlayChart = LightweightCharts.createChart(overlayChartEl, {
-            ...chartOptions,
-            width: overlayChartEl.offsetWidth,
-            height: 600,
-            rightPriceScale: {
-                borderColor: '#2a2a3e',
-                scaleMargins: { top: 0.05, bottom: 0.15 },
-                visible: true
-            },
-            leftPriceScale: {
-                borderColor: '#2a2a3e',
-                scaleMargins: { top: 0.05, bottom: 0.15 },
-                visible: true
-            }
-        });
+        const overlayChart = LightweightCharts.createChart(overlayChartEl,
+            sizedChartOptions(overlayChartEl.offsetWidth, 600, overlayChartOptions));
 
-        // Volume chart MUST have same width as main chart for alignment
-        const overlayVolChart = LightweightCharts.createChart(overlayVolChartEl, {
-            ...chartOptions,
-            width: overlayChartEl.offsetWidth,  // Use MAIN chart's width!
-            height: 150,
-            rightPriceScale: { visible: true, scaleMargins: { top: 0.1, bottom: 0 } },
-            leftPriceScale: { visible: false },
-            timeScale: {
-                visible: false,
-                rightOffset: 5,
-                barSpacing: 6,
-                minBarSpacing: 3
-            }
-        });
+        // Volume chart MUST have same width as main chart for alignment (use MAIN chart's width!)
+        const overlayVolChart = LightweightCharts.createChart(overlayVolChartEl,
+            sizedChartOptions(overlayChartEl.offsetWidth, 150, overlayVolChartOptions));
 
         // BTC Candlesticks (main series on RIGHT price scale)
-        const overlayBtcSeries = overlayChart.addCandlestickSeries({
-            upColor: '#26a69a',
-            downColor: '#ef5350',
-            borderUpColor: '#26a69a',
-            borderDownColor: '#ef5350',
-            wickUpColor: '#26a69a',
-            wickDownColor: '#ef5350',
+        const overlayBtcSeries = overlayChart.addCandlestickSeries(Object.assign({}, CANDLE_TEAL, {
             priceScaleId: 'right',
             priceFormat: { type: 'price', precision: 2, minMove: 0.01 }
-        });
+        }));
 
         // ES Line (% change on LEFT price scale) - blue like TradingView
         const overlayEsSeries = overlayChart.addLineSeries({
@@ -1377,6 +1667,8 @@ class LiveDashboardServer:
         let overlayDragging = false;
         let overlayDragTimer = null;
         let syncingOverlay = false;
+        let syncRaf = 0;
+        let lastVolBarSpacing = null;  // last barSpacing pushed to the volume chart
 
         function markOverlayDragging() {
             overlayDragging = true;
@@ -1385,11 +1677,10 @@ class LiveDashboardServer:
         }
 
         // Track mouse/touch/scroll state on overlay chart containers
-        const overlayMainEl = document.getElementById('overlay-main-chart');
-        const overlayVolEl = document.getElementById('overlay-volume-chart');
-        [overlayMainEl, overlayVolEl].forEach(el => {
+        [overlayChartEl, overlayVolChartEl].forEach(el => {
             if (el) {
-                ['mousedown', 'mouseup', 'mouseleave', 'wheel', 'touchstart', 'touchmove'].forEach(evt => {
+                // Pointer events cover mouse and touch presses with one listener each
+                ['pointerdown', 'pointerup', 'pointerleave', 'wheel', 'touchmove'].forEach(evt => {
                     el.addEventListener(evt, markOverlayDragging, { passive: true });
                 });
             }
@@ -1400,20 +1691,23 @@ class LiveDashboardServer:
             if (syncingOverlay || overlayDragging) return;
             syncingOverlay = true;
             try {
+                const mainScale = overlayChart.timeScale();
+                const volScale = overlayVolChart.timeScale();
                 // Sync visible range
-                const range = overlayChart.timeScale().getVisibleLogicalRange();
+                const range = mainScale.getVisibleLogicalRange();
                 if (isValidRange(range)) {
-                    overlayVolChart.timeScale().setVisibleLogicalRange(range);
+                    volScale.setVisibleLogicalRange(range);
                 }
                 // Sync scroll position for pixel-perfect alignment
-                const scrollPos = overlayChart.timeScale().scrollPosition();
+                const scrollPos = mainScale.scrollPosition();
                 if (scrollPos != null && isFinite(scrollPos)) {
-                    overlayVolChart.timeScale().scrollToPosition(scrollPos, false);
+                    volScale.scrollToPosition(scrollPos, false);
                 }
-                // Sync bar spacing
-                const bs = overlayChart.timeScale().options().barSpacing;
-                if (bs && isFinite(bs) && bs > 0) {
-                    overlayVolChart.timeScale().applyOptions({ barSpacing: bs });
+                // Sync bar spacing (only when it changed - applyOptions re-lays out the chart)
+                const bs = mainScale.options().barSpacing;
+                if (bs && isFinite(bs) && bs > 0 && bs !== lastVolBarSpacing) {
+                    volScale.applyOptions({ barSpacing: bs });
+                    lastVolBarSpacing = bs;
                 }
             } catch(e) {
                 // Chart mid-transition - ignore
@@ -1421,107 +1715,163 @@ class LiveDashboardServer:
             syncingOverlay = false;
         }
 
+        // Coalesce range events into at most one sync per animation frame; the same
+        // frame re-positions the floating ES label for the new scale
+        function scheduleSync() {
+            if (syncRaf || syncingOverlay || overlayDragging) return;
+            syncRaf = requestAnimationFrame(() => {
+                syncRaf = 0;
+                syncVolToMain();
+                repositionEsPriceLabel();
+            });
+        }
+
         // Main chart drives the volume chart - sync on both events (but not during drag)
-        overlayChart.timeScale().subscribeVisibleLogicalRangeChange(() => {
-            if (!syncingOverlay && !overlayDragging) syncVolToMain();
-        });
-        overlayChart.timeScale().subscribeVisibleTimeRangeChange(() => {
-            if (!syncingOverlay && !overlayDragging) syncVolToMain();
-        });
+        overlayChart.timeScale().subscribeVisibleLogicalRangeChange(scheduleSync);
+        overlayChart.timeScale().subscribeVisibleTimeRangeChange(scheduleSync);
+
+        // Overlay volume bar colors, indexed by +(close >= open): [down, up]
+        const OVERLAY_VOL_COLORS = ['rgba(239, 83, 80, 0.6)', 'rgba(38, 166, 154, 0.6)'];
 
         // Store data for overlay
         let overlayBtcData = [];
         let overlayEsData = [];
         let overlayEsBase = null;
+        let overlayEsScale = 0;  // 100 / overlayEsBase, so per-tick % is one multiply
+        let overlayEsDrawnBase = null;  // base the drawn ES % line was computed from
+        let overlayEsReady = false;  // ES % series holds data, so priceToCoordinate has a scale
+        let overlayBtcFirst = null;  // first BTC close the overlay % is measured from
+        let overlayBtcScale = 0;  // 100 / overlayBtcFirst
         let currentOverlayBtcBar = null;
         let currentOverlayEsBar = null;
         let overlayEsPriceLine = null;
+
+        function setOverlayEsBase(base) {
+            overlayEsBase = base;
+            overlayEsScale = base ? 100 / base : 0;
+        }
+        function overlayEsPct(price) {
+            return (price - overlayEsBase) * overlayEsScale;
+        }
+        // BTC overlay % vs the oldest bar in the ring. The first close and its reciprocal are
+        // cached scalars, refreshed only where btcData changes (backfill reset, bar commit)
+        function refreshOverlayBtcFirst() {
+            const first = btcData.length > 0 ? btcData.closeAt(0) : null;
+            if (first === overlayBtcFirst) return;
+            overlayBtcFirst = first;
+            overlayBtcScale = first ? 100 / first : 0;
+        }
+        function overlayBtcPct(price) {
+            return (price - overlayBtcFirst) * overlayBtcScale;
+        }
         let overlayResetting = false;  // guard to avoid update/setData races
 
         // ES price label positioning function
         function updateEsPriceLabel(esPrice, esPctValue) {
-            const label = document.getElementById('es-price-label');
+            const label = dom.esPriceLabel;
             if (!label || esPrice == null || esPctValue == null) return;
 
             // Update label text with actual ES price
-            label.textContent = 'ES: ' + esPrice.toFixed(2);
-
-            // CRITICAL FIX: Only use priceToCoordinate if series has data
-            // This prevents "Value is null" errors when chart is not ready
-            try {
-                // Verify series has data before calling priceToCoordinate
-                const hasData = overlayEsData && overlayEsData.length > 0;
-                if (hasData && isFinite(esPctValue)) {
-                    const y = overlayEsSeries.priceToCoordinate(esPctValue);
-                    if (y != null && isFinite(y) && y > 0 && y < 600) {
-                        label.style.top = (y - 8) + 'px';  // Center vertically on the line
-                    } else {
-                        chartWarn('skip price label - offscreen', { esPctValue, y });
-                    }
+            if (hundredthsChanged(label, esPrice)) setText(label, 'ES: ' + esPrice.toFixed(2));
+
+            // Only use priceToCoordinate once the series has data ("Value is null" otherwise)
+            if (!overlayEsReady || !isFinite(esPctValue)) return;
+            const y = overlayEsSeries.priceToCoordinate(esPctValue);
+            if (y != null && isFinite(y) && y > 0 && y < 600) {
+                // Center vertically on the line; transform keeps the move on the compositor (no layout)
+                const offset = y - 8;
+                if (label._lastOffset !== offset) {
+                    label.style.transform = 'translate3d(0,' + offset + 'px,0)';
+                    label._lastOffset = offset;
                 }
-            } catch (e) {
-                chartWarn('price label update failed', { error: e?.message });
+            } else {
+                chartWarn('skip price label - offscreen', { esPctValue, y });
             }
         }
 
-        // Re-position ES label when chart scales/zooms - use RAF for smooth updates
-        // Skip during drag to prevent errors
-        let esPriceLabelRaf = null;
-        overlayChart.timeScale().subscribeVisibleLogicalRangeChange(() => {
+        // Re-position ES label when chart scales/zooms (runs from the scheduleSync rAF)
+        function repositionEsPriceLabel() {
             if (overlayDragging) return;  // Don't update during drag
-            if (esPriceLabelRaf) cancelAnimationFrame(esPriceLabelRaf);
-            esPriceLabelRaf = requestAnimationFrame(() => {
-                if (overlayDragging) return;  // Double-check after RAF
-                if (esData.length > 0 && overlayEsBase && overlayEsData.length > 0) {
-                    const lastEs = esData[esData.length - 1];
-                    const esPct = ((lastEs.close - overlayEsBase) / overlayEsBase) * 100;
-                    try { updateEsPriceLabel(lastEs.close, esPct); } catch(e) {}
-                }
-            });
-        });
+            if (esData.length > 0 && overlayEsBase && overlayEsData.length > 0) {
+                const lastEs = esData.at(-1);
+                const esPct = overlayEsPct(lastEs.close);
+                try { updateEsPriceLabel(lastEs.close, esPct); } catch(e) {}
+            }
+        }
 
         // Fast tick update for overlay chart (called on each tick)
-        // Skip during drag to prevent "Value is null" errors
-        function updateOverlayTick(symbol, price) {
+        // Series writers for the tick path, defined once (no per-tick closures).
+        // Skip the chart call when the point is identical to the last one drawn.
+        const drawnOverlayBtc = { time: null, high: null, low: null, close: null };
+        const drawnOverlayEs = { time: null, value: null };
+        function pushOverlayBtcBar() {
+            const bar = currentOverlayBtcBar;
+            const d = drawnOverlayBtc;
+            if (bar.time === d.time && bar.close === d.close && bar.high === d.high && bar.low === d.low) return;
+            overlayBtcSeries.update(bar);
+            d.time = bar.time; d.high = bar.high; d.low = bar.low; d.close = bar.close;
+        }
+        function pushOverlayEsPoint() {
+            const point = currentOverlayEsBar;
+            if (point.time === drawnOverlayEs.time && point.value === drawnOverlayEs.value) return;
+            overlayEsSeries.update(point);
+            drawnOverlayEs.time = point.time; drawnOverlayEs.value = point.value;
+        }
+
+        // Overlay header values, written to the DOM at most once per frame via scheduleUpdate
+        // (tick and bar paths share the keys, so the latest write in a frame wins)
+        const overlayHeader = { btcPrice: null, btcPct: null, esPrice: null, esPct: null };
+        function renderOverlayBtcHeader() {
+            setFixed2(dom.overlayBtcPrice, overlayHeader.btcPrice);
+            if (overlayHeader.btcPct != null) setPctText(dom.overlayBtcPct, overlayHeader.btcPct);
+        }
+        function renderOverlayEsHeader() {
+            setFixed2(dom.overlayEsPrice, overlayHeader.esPrice);
+            setPctText(dom.overlayEsPct, overlayHeader.esPct);
+            // Floating ES price label on right axis
+            try { updateEsPriceLabel(overlayHeader.esPrice, overlayHeader.esPct); } catch(e) {}
+        }
+        function setOverlayBtcHeader(price, pct) {
+            overlayHeader.btcPrice = price;
+            overlayHeader.btcPct = pct;
+            scheduleUpdate('overlay-btc-header', renderOverlayBtcHeader);
+        }
+        function setOverlayEsHeader(price, pct) {
+            overlayHeader.esPrice = price;
+            overlayHeader.esPct = pct;
+            scheduleUpdate('overlay-es-header', renderOverlayEsHeader);
+        }
+
+        // Called once per frame from flushTicks with that frame's folded high/low/close
+        // and minute bucket. Skip during drag to prevent "Value is null" errors
+        function updateOverlayTick(symbol, now, price, high = price, low = price) {
             if (overlayDragging || overlayResetting || isAnyInteraction()) return;  // Don't update series during drag/zoom/reset
             try {
                 if (price == null || !isFinite(price)) return;
 
-                const now = Math.floor(Date.now() / 1000 / 60) * 60;
-
                 if (symbol === 'BTC') {
                     // Update BTC candle - with visible range guard
                     if (overlayBtcData.length === 0) return;  // Need initial data first
                     if (!currentOverlayBtcBar || currentOverlayBtcBar.time !== now) {
-                        const lastClose = btcData.length > 0 ? btcData[btcData.length - 1].close : price;
-                        currentOverlayBtcBar = { time: now, open: lastClose, high: price, low: price, close: price };
+                        const lastClose = btcData.length > 0 ? btcData.closeAt(-1) : price;
+                        currentOverlayBtcBar = { time: now, open: lastClose, high: high, low: low, close: price };
                     } else {
-                        currentOverlayBtcBar.high = Math.max(currentOverlayBtcBar.high, price);
-                        currentOverlayBtcBar.low = Math.min(currentOverlayBtcBar.low, price);
+                        if (high > currentOverlayBtcBar.high) currentOverlayBtcBar.high = high;
+                        if (low < currentOverlayBtcBar.low) currentOverlayBtcBar.low = low;
                         currentOverlayBtcBar.close = price;
                     }
                     // Only update if chart has valid visible range
                     const visRange = overlayChart.timeScale().getVisibleLogicalRange();
                     if (isValidRange(visRange)) {
-                        throttledChartOp('overlay-btc', 50, () => overlayBtcSeries.update(currentOverlayBtcBar));
+                        throttledChartOp('overlay-btc', 50, pushOverlayBtcBar);
                     }
 
                     // Update header
-                    const btcPriceEl = document.getElementById('overlay-btc-price');
-                    if (btcPriceEl) btcPriceEl.textContent = price.toFixed(2);
-                    if (btcData.length > 0) {
-                        const firstBtc = btcData[0];
-                        const btcPct = ((price - firstBtc.close) / firstBtc.close) * 100;
-                        const btcPctEl = document.getElementById('overlay-btc-pct');
-                        if (btcPctEl) {
-                            btcPctEl.textContent = (btcPct >= 0 ? '+' : '') + btcPct.toFixed(2) + '%';
-                            btcPctEl.style.color = btcPct >= 0 ? '#26a69a' : '#ef5350';
-                        }
-                    }
+                    setOverlayBtcHeader(price, overlayBtcFirst !== null ? overlayBtcPct(price) : null);
                 } else if (symbol === 'ES') {
                     // Update ES % line - with visible range guard
                     if (overlayEsBase && esData.length > 0 && overlayEsData.length > 0) {
-                        const esPct = ((price - overlayEsBase) / overlayEsBase) * 100;
+                        const esPct = overlayEsPct(price);
                         if (!isFinite(esPct)) return;
 
                         if (!currentOverlayEsBar || currentOverlayEsBar.time !== now) {
@@ -1532,20 +1882,11 @@ class LiveDashboardServer:
                         // Only update if chart has valid visible range
                         const visRange = overlayChart.timeScale().getVisibleLogicalRange();
                         if (isValidRange(visRange)) {
-                            throttledChartOp('overlay-es', 50, () => overlayEsSeries.update(currentOverlayEsBar));
+                            throttledChartOp('overlay-es', 50, pushOverlayEsPoint);
                         }
 
-                        // Update header with ES price and %
-                        const esPriceEl = document.getElementById('overlay-es-price');
-                        if (esPriceEl) esPriceEl.textContent = price.toFixed(2);
-                        const esPctEl = document.getElementById('overlay-es-pct');
-                        if (esPctEl) {
-                            esPctEl.textContent = (esPct >= 0 ? '+' : '') + esPct.toFixed(2) + '%';
-                            esPctEl.style.color = esPct >= 0 ? '#26a69a' : '#ef5350';
-                        }
-
-                        // Update floating ES price label on right axis
-                        updateEsPriceLabel(price, esPct);
+                        // Update header with ES price and % (and the floating axis label)
+                        setOverlayEsHeader(price, esPct);
                     }
                 }
             } catch (e) {
@@ -1553,88 +1894,210 @@ class LiveDashboardServer:
             }
         }
 
-        // Function to update overlay chart (full reset - called on bar completion)
+        // Index just past the ring bar matching the overlay's last point, or -1 when the
+        // ring no longer simply extends what is drawn (reload, out-of-order bar, or the
+        // drawn history has grown to twice the ring and should be trimmed)
+        function overlayTailStart(ring, overlayData) {
+            if (overlayData.length === 0 || ring.length === 0 || overlayData.length >= 2 * ring.cap) return -1;
+            const lastTime = overlayData[overlayData.length - 1].time;
+            let i = ring.length - 1;
+            while (i >= 0 && ring.timeAt(i) > lastTime) {
+                if (i > 0 && ring.timeAt(i - 1) >= ring.timeAt(i)) return -1;
+                i--;
+            }
+            return (i >= 0 && ring.timeAt(i) === lastTime) ? i + 1 : -1;
+        }
+
+        const volDataPool = [];  // reused by resetOverlayBtc across rebuilds
+        function overlayVolPoint(bar) {
+            return { time: bar.time, value: bar.volume, color: OVERLAY_VOL_COLORS[+(bar.close >= bar.open)] };
+        }
+
+        // Append-only fast path: update() the bars closed since the last draw (the matched
+        // last point is redrawn too, it may have been replaced). False means rebuild.
+        function extendOverlayBtc() {
+            const start = overlayTailStart(btcData, overlayBtcData);
+            if (start < 0) return false;
+            try {
+                for (let i = start - 1; i < btcData.length; i++) {
+                    const bar = btcData.at(i);
+                    overlayBtcSeries.update(bar);
+                    if (bar.volume > 0) overlayBtcVolSeries.update(overlayVolPoint(bar));
+                    if (i < start) overlayBtcData[overlayBtcData.length - 1] = bar;
+                    else overlayBtcData.push(bar);
+                }
+            } catch (e) {
+                return false;  // older than the live point - caller rebuilds
+            }
+            drawnOverlayBtc.time = null;
+            if (btcData.length > start) currentOverlayBtcBar = null;
+            return true;
+        }
+
+        function extendOverlayEs() {
+            if (overlayEsDrawnBase !== overlayEsBase) return false;
+            const start = overlayTailStart(esData, overlayEsData);
+            if (start < 0) return false;
+            try {
+                for (let i = start - 1; i < esData.length; i++) {
+                    const point = { time: esData.timeAt(i), value: overlayEsPct(esData.closeAt(i)) };
+                    overlayEsSeries.update(point);
+                    if (i < start) overlayEsData[overlayEsData.length - 1] = point;
+                    else overlayEsData.push(point);
+                }
+            } catch (e) {
+                return false;
+            }
+            drawnOverlayEs.time = null;
+            if (esData.length > start) currentOverlayEsBar = null;
+            return true;
+        }
+
+        function resetOverlayBtc() {
+            overlayBtcData = btcData.toArray();
+            try { overlayBtcSeries.setData(overlayBtcData); } catch(e) { chartWarn('overlay btc setData failed', { error: e?.message }); }
+            drawnOverlayBtc.time = null;
+
+            // Volume with color - one pass, overwriting pooled point objects in place
+            // (setData copies the values into the series, so the pool is free to reuse)
+            let volCount = 0;
+            for (let i = 0; i < overlayBtcData.length; i++) {
+                const d = overlayBtcData[i];
+                if (!(d.volume > 0)) continue;
+                const point = volDataPool[volCount] || (volDataPool[volCount] = {});
+                point.time = d.time;
+                point.value = d.volume;
+                point.color = OVERLAY_VOL_COLORS[+(d.close >= d.open)];
+                volCount++;
+            }
+            volDataPool.length = volCount;
+            try { overlayBtcVolSeries.setData(volDataPool); } catch(e) { chartWarn('overlay vol setData failed', { error: e?.message }); }
+        }
+
+        function resetOverlayEs() {
+            overlayEsData = new Array(esData.length);
+            for (let i = 0; i < esData.length; i++) {
+                overlayEsData[i] = {
+                    time: esData.timeAt(i),
+                    value: overlayEsPct(esData.closeAt(i))
+                };
+            }
+            try {
+                overlayEsSeries.setData(overlayEsData);
+                overlayEsReady = overlayEsData.length > 0;
+            } catch(e) {
+                overlayEsReady = false;
+                chartWarn('overlay es setData failed', { error: e?.message });
+            }
+            drawnOverlayEs.time = null;
+            overlayEsDrawnBase = overlayEsBase;
+        }
+
+        // Bring the overlay chart up to date with btcData/esData. Appends new bars with
+        // update(); setData only on first render, history reload (full) or ES base change.
         // Skip during drag to prevent errors
-        function updateOverlayChart() {
+        function updateOverlayChart(full = false) {
             if (overlayDragging) return;  // Don't reset data during drag
             // Allow partial rendering: only skip if BOTH datasets are empty
             if (btcData.length === 0 && esData.length === 0) return;
 
-            overlayResetting = true;
+            let rebuilt = false;
             try {
                 // BTC overlay (candlesticks + volume) - only if we have BTC data
-                if (btcData.length > 0) {
-                    overlayBtcData = btcData.slice();
-                    try { overlayBtcSeries.setData(overlayBtcData); } catch(e) { chartWarn('overlay btc setData failed', { error: e?.message }); }
-
-                    // Volume with color
-                    const volData = btcData.map(d => ({
-                        time: d.time,
-                        value: d.volume || 0,
-                        color: d.close >= d.open ? 'rgba(38, 166, 154, 0.6)' : 'rgba(239, 83, 80, 0.6)'
-                    })).filter(d => d.value > 0);
-                    try { overlayBtcVolSeries.setData(volData); } catch(e) { chartWarn('overlay vol setData failed', { error: e?.message }); }
+                if (btcData.length > 0 && (full || !extendOverlayBtc())) {
+                    overlayResetting = true;
+                    resetOverlayBtc();
+                    rebuilt = true;
                 }
 
                 // ES overlay (% line) - only if we have ES data and base price
                 if (esData.length > 0) {
                     if (!overlayEsBase) {
-                        overlayEsBase = esBasePrice ?? esData[0].close;
+                        setOverlayEsBase(esBasePrice ?? esData.closeAt(0));
                     }
-                    if (overlayEsBase) {
-                        overlayEsData = esData.map(d => ({
-                            time: d.time,
-                            value: ((d.close - overlayEsBase) / overlayEsBase) * 100
-                        }));
-                        try { overlayEsSeries.setData(overlayEsData); } catch(e) { chartWarn('overlay es setData failed', { error: e?.message }); }
+                    if (overlayEsBase && (full || !extendOverlayEs())) {
+                        overlayResetting = true;
+                        resetOverlayEs();
+                        rebuilt = true;
                     }
                 }
 
                 // Sync time scales - volume follows main chart EXACTLY
-                if (!overlayDragging) {
+                if (rebuilt && !overlayDragging) {
                     overlayChart.timeScale().fitContent();
-                    // Force perfect sync after a brief delay for rendering
-                    setTimeout(() => { if (!overlayDragging) syncVolToMain(); }, 50);
-                    setTimeout(() => { if (!overlayDragging) syncVolToMain(); }, 200);
+                    // Re-sync on the next frame (after setData is laid out) and once more on the
+                    // frame after, so both passes track paint rather than wall-clock delays
+                    requestAnimationFrame(() => {
+                        syncVolToMain();
+                        requestAnimationFrame(syncVolToMain);
+                    });
                 }
             } catch(e) {
                 // Chart mid-transition - ignore
             } finally {
-                setTimeout(() => { overlayResetting = false; }, 100);  // leave guard up briefly to avoid async render race
+                if (overlayResetting) setTimeout(() => { overlayResetting = false; }, 100);  // leave guard up briefly to avoid async render race
             }
 
             // Update header values
             if (btcData.length > 0) {
-                const lastBtc = btcData[btcData.length - 1];
-                const firstBtc = btcData[0];
-                const btcPct = ((lastBtc.close - firstBtc.close) / firstBtc.close) * 100;
-
-                const btcPriceEl = document.getElementById('overlay-btc-price');
-                const btcPctEl = document.getElementById('overlay-btc-pct');
-                if (btcPriceEl) btcPriceEl.textContent = lastBtc.close.toFixed(2);
-                if (btcPctEl) {
-                    btcPctEl.textContent = (btcPct >= 0 ? '+' : '') + btcPct.toFixed(2) + '%';
-                    btcPctEl.style.color = btcPct >= 0 ? '#26a69a' : '#ef5350';
-                }
+                const lastBtcClose = btcData.closeAt(-1);
+                setOverlayBtcHeader(lastBtcClose, overlayBtcPct(lastBtcClose));
             }
 
             if (esData.length > 0 && overlayEsBase) {
-                const lastEs = esData[esData.length - 1];
-                const esPct = ((lastEs.close - overlayEsBase) / overlayEsBase) * 100;
-
-                // Show ES actual price
-                const esPriceEl = document.getElementById('overlay-es-price');
-                if (esPriceEl) esPriceEl.textContent = lastEs.close.toFixed(2);
-
-                // Show ES % change
-                const esPctEl = document.getElementById('overlay-es-pct');
-                if (esPctEl) {
-                    esPctEl.textContent = (esPct >= 0 ? '+' : '') + esPct.toFixed(2) + '%';
-                    esPctEl.style.color = esPct >= 0 ? '#26a69a' : '#ef5350';
-                }
+                const lastEs = esData.at(-1);
+                const esPct = overlayEsPct(lastEs.close);
 
-                // Update floating ES price label on right axis
-                try { updateEsPriceLabel(lastEs.close, esPct); } catch(e) {}
+                // Show ES actual price and % change (and the floating axis label)
+                setOverlayEsHeader(lastEs.close, esPct);
+            }
+        }
+        // Fallback full rebuild (out-of-order bar, drag, oversized arrays) at most 2x/sec
+        const throttledUpdateOverlayChart = throttle(updateOverlayChart, 500);
+
+        // Init/anchor refreshes run with the next frame's batched updates, so several
+        // requests in one frame (e.g. init re-anchoring, then reloading history) draw once;
+        // a full redraw requested by any of them wins
+        let overlayFullPending = false;
+        function scheduleOverlayChart(full = false) {
+            if (full) overlayFullPending = true;
+            scheduleUpdate('overlay-chart', flushOverlayChart);
+        }
+        function flushOverlayChart() {
+            const full = overlayFullPending;
+            overlayFullPending = false;
+            updateOverlayChart(full);
+        }
+
+        // Completed bar on the overlay: update() only the newest point instead of setData
+        function appendOverlayBar(symbol, bar) {
+            const overlayData = symbol === 'BTC' ? overlayBtcData : overlayEsData;
+            const ring = symbol === 'BTC' ? btcData : esData;
+            if (overlayDragging || overlayResetting || overlayData.length === 0 ||
+                overlayData.length >= 2 * ring.cap) {
+                throttledUpdateOverlayChart();
+                return;
+            }
+            try {
+                if (symbol === 'BTC') {
+                    overlayBtcSeries.update(bar);
+                    drawnOverlayBtc.time = null;
+                    if (bar.volume > 0) overlayBtcVolSeries.update(overlayVolPoint(bar));
+                    if (overlayBtcData.at(-1).time === bar.time) overlayBtcData[overlayBtcData.length - 1] = bar;
+                    else overlayBtcData.push(bar);
+                    currentOverlayBtcBar = null;
+                } else {
+                    if (!overlayEsBase) return;
+                    const point = { time: bar.time, value: overlayEsPct(bar.close) };
+                    overlayEsSeries.update(point);
+                    drawnOverlayEs.time = null;
+                    if (overlayEsData.at(-1).time === point.time) overlayEsData[overlayEsData.length - 1] = point;
+                    else overlayEsData.push(point);
+                    currentOverlayEsBar = null;
+                }
+            } catch (e) {
+                // Bar is older than the overlay's live point - rebuild instead
+                throttledUpdateOverlayChart();
             }
         }
         // ========== END: TradingView-Style Overlay Chart ==========
@@ -1648,22 +2111,15 @@ class LiveDashboardServer:
         }
 
         // Sync crosshairs between paired charts
-        // Track if user is dragging/zooming (don't sync during interaction)
-        let isDragging = false;
-        let dragTimer = null;
-        function markDragging() {
-            isDragging = true;
-            if (dragTimer) clearTimeout(dragTimer);
-            dragTimer = setTimeout(() => { isDragging = false; }, 400);
-        }
-        // NOTE: mousedown/mouseup removed - they block measurement clicks!
-        // Only wheel/touch events should trigger drag detection
-        ['wheel', 'touchstart', 'touchmove'].forEach(evt => {
-            document.addEventListener(evt, markDragging, { passive: true });
-        });
+        // Dragging/zooming is detected by isUserInteracting (don't sync during interaction)
 
         // Find nearest timestamp in data array (binary search)
         // This is critical because ES and BTC have different trading hours
+        // Bar time at index i; RingBuf reads its Float64Array column, arrays the object
+        function barTimeAt(dataArray, i) {
+            return dataArray.timeAt ? dataArray.timeAt(i) : dataArray[i].time;
+        }
+
         function findNearestTime(dataArray, targetTime) {
             if (!dataArray || dataArray.length === 0) return null;
 
@@ -1673,7 +2129,7 @@ class LiveDashboardServer:
             // Binary search
             while (left < right) {
                 const mid = Math.floor((left + right) / 2);
-                if (dataArray[mid].time < targetTime) {
+                if (barTimeAt(dataArray, mid) < targetTime) {
                     left = mid + 1;
                 } else {
                     right = mid;
@@ -1682,24 +2138,72 @@ class LiveDashboardServer:
 
             // Bounds check: if left exceeds array, return last element
             if (left >= dataArray.length) {
-                return dataArray[dataArray.length - 1];
+                return dataArray.at(-1);
             }
 
             // Check if left or left-1 is closer
             if (left > 0) {
-                const diffLeft = Math.abs(dataArray[left].time - targetTime);
-                const diffPrev = Math.abs(dataArray[left - 1].time - targetTime);
+                const diffLeft = Math.abs(barTimeAt(dataArray, left) - targetTime);
+                const diffPrev = Math.abs(barTimeAt(dataArray, left - 1) - targetTime);
                 if (diffPrev < diffLeft) {
-                    return dataArray[left - 1];
+                    return dataArray.at(left - 1);
                 }
             }
 
-            return dataArray[left];
+            return dataArray.at(left);
         }
 
         const CROSSHAIR_TOLERANCE = 60;  // seconds for 1m charts
+        // Mousemove fires at 60-120Hz; mirroring the crosshair at ~30fps is visually identical.
+        // Each pair throttles on its own, with a trailing sync so the peer lands on the final bar
+        const CROSSHAIR_MIN_DELTA = 32;  // ms
+
+        function syncCharts(chart1, series1, chart2, series2, getTargetData, label) {
+            const timeScale2 = chart2 ? chart2.timeScale() : null;
+            // Crosshair time is quantized to the candle, so most moves land on the bar already mirrored
+            let lastSyncedTime = null;
+            let lastSyncedPrice = null;
+            // Newest move not yet mirrored; the throttled flush always takes the latest one
+            let pendingTime = null;
+            let pendingPrice = null;
+
+            function mirrorCrosshair(time, price) {
+                const targetData = getTargetData();
+                if (!chart2 || !series2 || !targetData || targetData.length === 0) return;
+
+                const nearestBar = findNearestTime(targetData, time);
+                if (!nearestBar || nearestBar.time == null) return;
+
+                const timeDelta = Math.abs(nearestBar.time - time);
+                if (timeDelta > CROSSHAIR_TOLERANCE) return;
+
+                const nearestPrice = nearestBar.close ?? nearestBar.value ?? price;
+                if (nearestPrice == null || !isFinite(nearestPrice)) return;
+
+                const visRange = timeScale2.getVisibleRange();
+                if (!visRange || !isFinite(visRange.from) || !isFinite(visRange.to)) return;
+                if (nearestBar.time < visRange.from || nearestBar.time > visRange.to) return;
+
+                try {
+                    chart2.setCrosshairPosition(nearestPrice, nearestBar.time, series2);
+                    lastSyncedTime = time;
+                    lastSyncedPrice = price;
+                } catch (syncErr) {
+                    chartWarn('crosshair sync failed', { error: syncErr?.message, time: nearestBar.time });
+                }
+            }
+
+            const flushCrosshair = throttle(() => {
+                if (pendingTime == null || isAnyInteraction()) return;
+                const time = pendingTime, price = pendingPrice;
+                pendingTime = pendingPrice = null;
+                try {
+                    mirrorCrosshair(time, price);
+                } catch (e) {
+                    chartWarn('syncCharts error', { error: e?.message });
+                }
+            }, CROSSHAIR_MIN_DELTA);
 
-        function syncCharts(chart1, series1, chart2, series2, dataArray, label) {
             chart1.subscribeCrosshairMove(param => {
                 // Don't sync during interactions (but don't clear measurement - keep it sticky)
                 if (isAnyInteraction()) return;
@@ -1708,29 +2212,17 @@ class LiveDashboardServer:
                     if (param && param.time != null && param.point && param.seriesData) {
                         const data = param.seriesData.get(series1);
                         const price = data ? (data.close ?? data.value) : null;
-                        const targetData = dataArray;
                         if (price == null || !isFinite(price)) return;
-                        if (!chart2 || !series2 || !targetData || targetData.length === 0) return;
-
-                        const nearestBar = findNearestTime(targetData, param.time);
-                        if (!nearestBar || nearestBar.time == null) return;
-
-                        const timeDelta = Math.abs(nearestBar.time - param.time);
-                        if (timeDelta > CROSSHAIR_TOLERANCE) return;
-
-                        const nearestPrice = nearestBar.close ?? nearestBar.value ?? price;
-                        if (nearestPrice == null || !isFinite(nearestPrice)) return;
-
-                        const visRange = chart2.timeScale().getVisibleRange();
-                        if (!visRange || !isFinite(visRange.from) || !isFinite(visRange.to)) return;
-                        if (nearestBar.time < visRange.from || nearestBar.time > visRange.to) return;
-
-                        try {
-                            chart2.setCrosshairPosition(nearestPrice, nearestBar.time, series2);
-                        } catch (syncErr) {
-                            chartWarn('crosshair sync failed', { error: syncErr?.message, time: nearestBar.time });
+                        if (param.time === lastSyncedTime && price === lastSyncedPrice) {
+                            pendingTime = pendingPrice = null;  // back on the mirrored bar
+                            return;
                         }
+                        pendingTime = param.time;
+                        pendingPrice = price;
+                        flushCrosshair();
                     } else if (!param || !param.point) {
+                        lastSyncedTime = null;
+                        pendingTime = pendingPrice = null;  // a trailing flush must not re-show it
                         try { chart2.clearCrosshairPosition(); } catch(e) {}
                         // Don't clear measurement - keep it sticky
                     }
@@ -1741,10 +2233,10 @@ class LiveDashboardServer:
         }
         // Hide crosshair when leaving chart wrappers (but keep measurement sticky)
         [
-            { el: document.getElementById('es-realtime'), chart: esRtChart, target: btcRtChart },
-            { el: document.getElementById('btc-realtime'), chart: btcRtChart, target: esRtChart },
-            { el: document.getElementById('es-historical'), chart: esHistChart, target: btcHistChart },
-            { el: document.getElementById('btc-historical'), chart: btcHistChart, target: esHistChart },
+            { el: dom.esRealtime, chart: esRtChart, target: btcRtChart },
+            { el: dom.btcRealtime, chart: btcRtChart, target: esRtChart },
+            { el: dom.esHistorical, chart: esHistChart, target: btcHistChart },
+            { el: dom.btcHistorical, chart: btcHistChart, target: esHistChart },
         ].forEach(({ el, chart, target }) => {
             if (!el || !chart || !target) return;
             el.addEventListener('mouseleave', () => {
@@ -1754,15 +2246,87 @@ class LiveDashboardServer:
                 // User must click Measure button or press Escape to clear
             });
         });
+        // Fixed-capacity circular buffer of bars: O(1) push/evict instead of Array.shift()
+        // Exposes length/at()/iteration so it can stand in for an array of bars.
+        // time/close are mirrored into Float64Array columns (SoA) for scans that
+        // only need those fields; bar objects are kept for chart boundaries.
+        class RingBuf {
+            constructor(cap) {
+                this.baseCap = cap;
+                this._alloc(cap);
+            }
+            _alloc(cap) {
+                this.cap = cap;
+                this.buf = new Array(cap);
+                this.times = new Float64Array(cap);
+                this.closes = new Float64Array(cap);
+                this.head = 0;
+                this.length = 0;
+            }
+            // Replace contents; a larger backfill widens capacity so nothing is dropped
+            reset(items) {
+                this._alloc(Math.max(this.baseCap, items.length));
+                const start = Math.max(0, items.length - this.cap);
+                for (let i = start; i < items.length; i++) this.push(items[i]);
+            }
+            // Append, returning the evicted item (if the buffer was full)
+            push(item) {
+                let evicted;
+                let slot;
+                if (this.length < this.cap) {
+                    slot = this._wrap(this.head + this.length);
+                    this.length++;
+                } else {
+                    slot = this.head;
+                    evicted = this.buf[slot];
+                    this.head = this._wrap(this.head + 1);
+                }
+                this.buf[slot] = item;
+                this.times[slot] = item.time;
+                this.closes[slot] = item.close;
+                return evicted;
+            }
+            // head + i is always < 2 * cap, so one conditional subtract replaces %
+            _wrap(pos) {
+                return pos >= this.cap ? pos - this.cap : pos;
+            }
+            _slot(i) {
+                if (i < 0) i += this.length;
+                if (i < 0 || i >= this.length) return -1;
+                return this._wrap(this.head + i);
+            }
+            at(i) {
+                const slot = this._slot(i);
+                return slot < 0 ? undefined : this.buf[slot];
+            }
+            timeAt(i) {
+                const slot = this._slot(i);
+                return slot < 0 ? NaN : this.times[slot];
+            }
+            closeAt(i) {
+                const slot = this._slot(i);
+                return slot < 0 ? NaN : this.closes[slot];
+            }
+            toArray() {
+                const out = new Array(this.length);
+                for (let i = 0; i < this.length; i++) out[i] = this.buf[this._wrap(this.head + i)];
+                return out;
+            }
+            *[Symbol.iterator]() {
+                for (let i = 0; i < this.length; i++) yield this.buf[this._wrap(this.head + i)];
+            }
+        }
+
         // Data storage for charts (IMMUTABLE bars - ticks don't modify these)
-        let esData = [];
-        let btcData = [];
+        const MAX_RT_BARS = 1440;
+        const esData = new RingBuf(MAX_RT_BARS);
+        const btcData = new RingBuf(MAX_RT_BARS);
         let esHistData = [];
         let btcHistData = [];
 
         // Anchor mode toggles
-        document.getElementById('anchor-globex')?.addEventListener('click', () => applyEsAnchor(ANCHOR_MODES.GLOBEX));
-        document.getElementById('anchor-cash')?.addEventListener('click', () => applyEsAnchor(ANCHOR_MODES.CASH));
+        dom.anchorGlobex?.addEventListener('click', () => applyEsAnchor(ANCHOR_MODES.GLOBEX));
+        dom.anchorCash?.addEventListener('click', () => applyEsAnchor(ANCHOR_MODES.CASH));
 
         // Range measurement toggle (button OR Shift+click)
         let measureMode = false;
@@ -1795,12 +2359,12 @@ class LiveDashboardServer:
                 return;
             }
             syncRegistered = true;
-            // Sync real-time charts (pass data arrays for time range validation)
-            syncCharts(esRtChart, esRtSeries, btcRtChart, btcRtSeries, btcData, 'ES');
-            syncCharts(btcRtChart, btcRtSeries, esRtChart, esRtSeries, esData, 'BTC');
-            // Sync historical charts
-            syncCharts(esHistChart, esHistSeries, btcHistChart, btcHistSeries, btcHistData, 'ES');
-            syncCharts(btcHistChart, btcHistSeries, esHistChart, esHistSeries, esHistData, 'BTC');
+            // Sync real-time charts (data getters for time range validation)
+            syncCharts(esRtChart, esRtSeries, btcRtChart, btcRtSeries, () => btcData, 'ES');
+            syncCharts(btcRtChart, btcRtSeries, esRtChart, esRtSeries, () => esData, 'BTC');
+            // Sync historical charts (getters: history arrays are replaced when it (re)loads)
+            syncCharts(esHistChart, esHistSeries, btcHistChart, btcHistSeries, () => btcHistData, 'ES');
+            syncCharts(btcHistChart, btcHistSeries, esHistChart, esHistSeries, () => esHistData, 'BTC');
             console.log('[SYNC] Crosshair sync registered after data loaded');
         }
 
@@ -1817,26 +2381,39 @@ class LiveDashboardServer:
         let tickCount = 0;
         let lastTickTime = Date.now();
 
-        // Latency tracking
+        // Latency tracking: a one-second tumbling window. The per-second interval below
+        // reads the mean and zeroes both accumulators, so they never grow beyond one
+        // second of samples and the display reflects current conditions only
         let latencySum = 0;
         let latencyCount = 0;
         let avgLatency = 0;
+        let lastRate = -1;
+        let lastAvgLatency = -1;
 
         // Update rate counter and latency every second
+        // Numbers are compared before any string is built, so a steady feed writes nothing
         setInterval(() => {
             const now = Date.now();
-            const elapsed = (now - lastTickTime) / 1000;
-            const rate = Math.round(tickCount / elapsed);
-            document.getElementById('btc-rate').textContent = rate;
+            const rate = Math.round(tickCount * 1000 / (now - lastTickTime));
+            if (rate !== lastRate) {
+                setText(dom.btcRate, String(rate));
+                lastRate = rate;
+            }
 
-            // Update latency display
+            // Update latency display (class only flips when the band changes)
             if (latencyCount > 0) {
                 avgLatency = Math.round(latencySum / latencyCount);
-                const latencyEl = document.getElementById('latency-display');
-                latencyEl.textContent = avgLatency + 'ms';
-                latencyEl.classList.remove('slow', 'very-slow');
-                if (avgLatency > 100) latencyEl.classList.add('very-slow');
-                else if (avgLatency > 50) latencyEl.classList.add('slow');
+                const latencyEl = dom.latency;
+                if (avgLatency !== lastAvgLatency) {
+                    setText(latencyEl, avgLatency + 'ms');
+                    lastAvgLatency = avgLatency;
+                }
+                const band = avgLatency > 100 ? 'very-slow' : avgLatency > 50 ? 'slow' : '';
+                if (latencyEl._lastBand !== band) {
+                    latencyEl.classList.remove('slow', 'very-slow');
+                    if (band) latencyEl.classList.add(band);
+                    latencyEl._lastBand = band;
+                }
             }
 
             tickCount = 0;
@@ -1846,11 +2423,21 @@ class LiveDashboardServer:
         }, 1000);
 
         // Pending DOM updates (batched with requestAnimationFrame)
-        let pendingUpdates = {};
+        // Reused parallel arrays + key->slot map so a frame's flush allocates nothing
+        const updateKeys = [];
+        const updateQueue = [];
+        const updateSlots = new Map();
         let rafScheduled = false;
 
         function scheduleUpdate(key, fn) {
-            pendingUpdates[key] = fn;
+            const slot = updateSlots.get(key);
+            if (slot !== undefined) {
+                updateQueue[slot] = fn;  // latest fn for a key wins
+            } else {
+                updateSlots.set(key, updateQueue.length);
+                updateKeys.push(key);
+                updateQueue.push(fn);
+            }
             if (!rafScheduled) {
                 rafScheduled = true;
                 requestAnimationFrame(flushUpdates);
@@ -1858,14 +2445,139 @@ class LiveDashboardServer:
         }
 
         function flushUpdates() {
-            const updates = pendingUpdates;
-            pendingUpdates = {};
+            // Length is re-read each pass so updates queued by a running update land in this frame
+            for (let i = 0; i < updateQueue.length; i++) {
+                updateSlots.delete(updateKeys[i]);
+                updateQueue[i]();
+            }
+            updateKeys.length = 0;
+            updateQueue.length = 0;
             rafScheduled = false;
-            for (const fn of Object.values(updates)) {
-                fn();
+        }
+
+        // Ticks received since the last frame, folded per symbol (high/low/close).
+        // One long-lived slot per symbol, reset via count, so the fold never allocates
+        // and the fields stay plain doubles of a single shape
+        const pendingTicks = {
+            ES: { high: 0, low: 0, close: 0, count: 0 },
+            BTC: { high: 0, low: 0, close: 0, count: 0 },
+        };
+
+        function queueTick(symbol, price) {
+            if (price == null || !isFinite(price)) return;
+            if (symbol !== 'ES' && symbol !== 'BTC') return;
+            const pending = pendingTicks[symbol];
+            if (pending.count === 0) {
+                pending.high = price;
+                pending.low = price;
+            } else {
+                if (price > pending.high) pending.high = price;
+                if (price < pending.low) pending.low = price;
+            }
+            pending.close = price;
+            pending.count++;
+            scheduleUpdate('ticks', flushTicks);
+        }
+
+        // Bars evicted from each ring since the chart was last setData'd
+        const chartEvictions = { ES: 0, BTC: 0 };
+
+        // Completed bar: update() on the live path; setData only to resync when the
+        // bar is older than the chart's live bar or the chart holds 2x the ring.
+        // `live` is the in-progress bar; if ticks already opened the next minute, update()
+        // would reject the older bar, so resync directly and redraw the live bar on top.
+        function commitBar(symbol, series, ring, bar, live) {
+            if (ring.push(bar) !== undefined) chartEvictions[symbol]++;
+            const liveAhead = live != null && live.time > bar.time;
+            if (!liveAhead && chartEvictions[symbol] < ring.cap) {
+                try {
+                    series.update(bar);
+                    return;
+                } catch (e) {
+                    // Out of order for update() - fall through to a full reset
+                }
+            }
+            chartEvictions[symbol] = 0;
+            try { series.setData(ring.toArray()); } catch (e) {}
+            if (liveAhead) {
+                try { series.update(live); } catch (e) {}
             }
         }
 
+        // Apply a folded tick range to the in-progress 1-min bar
+        function foldLiveBar(bar, completed, now, tick) {
+            if (!bar || bar.time !== now) {
+                const lastComplete = completed.length > 0 ? completed.at(-1) : null;
+                return {
+                    time: now,
+                    open: lastComplete ? lastComplete.close : tick.close,
+                    high: tick.high, low: tick.low, close: tick.close
+                };
+            }
+            if (tick.high > bar.high) bar.high = tick.high;
+            if (tick.low < bar.low) bar.low = tick.low;
+            bar.close = tick.close;
+            return bar;
+        }
+
+        // Series writers for the tick path, defined once (no per-tick closures)
+        // Live candles on a realtime chart scrolled out of view are not repainted; the
+        // current bar is pushed once when the chart comes back into view
+        function pushBtcLiveBar() {
+            if (!dom.btcRealtime._offscreen) btcRtSeries.update(currentBtcBar);
+        }
+        function pushEsLiveBar() {
+            if (!dom.esRealtime._offscreen) esRtSeries.update(currentEsBar);
+        }
+        if (typeof IntersectionObserver !== 'undefined') {
+            const livePushers = new Map([
+                [dom.esRealtime, () => currentEsBar && pushEsLiveBar()],
+                [dom.btcRealtime, () => currentBtcBar && pushBtcLiveBar()],
+            ]);
+            const liveChartObserver = new IntersectionObserver((entries) => {
+                for (const entry of entries) {
+                    entry.target._offscreen = !entry.isIntersecting;
+                    if (entry.isIntersecting) {
+                        try { livePushers.get(entry.target)(); } catch (e) {}
+                    }
+                }
+            });
+            for (const el of livePushers.keys()) if (el) liveChartObserver.observe(el);
+        }
+
+        // One chart/DOM pass per frame, however many ticks arrived
+        function flushTicks() {
+            const btc = pendingTicks.BTC.count ? pendingTicks.BTC : null;
+            const es = pendingTicks.ES.count ? pendingTicks.ES : null;
+            pendingTicks.BTC.count = 0;
+            pendingTicks.ES.count = 0;
+            // One clock read per frame; minute and hour buckets both derive from it
+            const nowMs = Date.now();
+            const now = Math.floor(nowMs / 60000) * 60;
+            const hour = Math.floor(nowMs / 3600000) * 3600;
+
+            if (btc) {
+                updatePrice(dom.btcPrice, btc.close, lastBtcPrice);
+                lastBtcPrice = btc.close;
+                currentBtcBar = foldLiveBar(currentBtcBar, btcData, now, btc);
+                throttledChartOp('batch-btc', 30, pushBtcLiveBar);
+                updateHourlyBar('BTC', hour, btc.close, btc.high, btc.low);
+                updateOverlayTick('BTC', now, btc.close, btc.high, btc.low);
+            }
+            if (es) {
+                updatePrice(dom.esPrice, es.close, lastEsPrice);
+                lastEsPrice = es.close;
+                if (esBasePrice == null && esData.length > 0) {
+                    setEsBasePrice(esData.closeAt(0));
+                }
+                currentEsBar = foldLiveBar(currentEsBar, esData, now, es);
+                throttledChartOp('batch-es', 30, pushEsLiveBar);
+                updateHourlyBar('ES', hour, es.close, es.high, es.low);
+                updateOverlayTick('ES', now, es.close);
+            }
+            if (btc || es) updatePctChange();
+        }
+
         // ========== RANGE MEASUREMENT ==========
         function getPriceFromCoordinate(series, chart, y) {
             // LightweightCharts v4.1.0 - use series.coordinateToPrice directly
@@ -2014,10 +2726,13 @@ class LiveDashboardServer:
                 let vol = 0;
                 const tMin = Math.min(start.time, endTime);
                 const tMax = Math.max(start.time, endTime);
-                const within = dataArr.filter(d => d.time >= tMin && d.time <= tMax);
-                if (within.length > 0) {
-                    bars = within.length;
-                    vol = within.reduce((s, d) => s + (d.volume || 0), 0);
+                // Index loop works for both plain arrays and RingBuf
+                for (let i = 0; i < dataArr.length; i++) {
+                    const d = dataArr.at(i);
+                    if (d.time >= tMin && d.time <= tMax) {
+                        bars++;
+                        vol += d.volume || 0;
+                    }
                 }
 
                 const seconds = Math.abs(endTime - start.time);
@@ -2076,7 +2791,7 @@ class LiveDashboardServer:
                 if (locked) return;
                 if (!start) return;
                 if (!param || !param.point) return;
-                if (isDragging) return;
+                if (isUserInteracting()) return;
                 updateSelection(param.point);
             });
 
@@ -2096,38 +2811,63 @@ class LiveDashboardServer:
         // Overlay chart (correlation) - uses BTC candlestick series for measurement
         measurementManagers.push(setupRangeMeasure('overlay-main-chart', overlayChart, overlayBtcSeries, () => overlayBtcData));
 
-        // Ultra-fast price update with requestAnimationFrame batching
+        // Ultra-fast price update with requestAnimationFrame batching. The pending value
+        // lives on the element and its render fn/key are built once, so a tick allocates
+        // no closure or key string
         function updatePrice(element, price, lastPrice) {
             if (!element || price === undefined || price === null) return;
-            scheduleUpdate('price-' + element.id, () => {
-                element.textContent = price.toFixed(2);
+            if (price === lastPrice) return;  // repeated print - nothing visible changes
+            element._pendingPrice = price;
+            element._pendingLastPrice = lastPrice;
+            if (!element._renderPrice) {
+                element._renderPrice = () => renderPrice(element);
+                element._priceKey = 'price-' + element.id;
+            }
+            scheduleUpdate(element._priceKey, element._renderPrice);
+        }
+        function renderPrice(element) {
+            // Only touch the DOM when the rendered text/direction actually changes
+            const price = element._pendingPrice;
+            const lastPrice = element._pendingLastPrice;
+            setFixed2(element, price);
+            const dir = lastPrice === null ? '' : (price >= lastPrice ? 'up' : 'down');
+            if (element._lastDir !== dir) {
                 element.classList.remove('up', 'down');
-                if (lastPrice !== null) {
-                    element.classList.add(price >= lastPrice ? 'up' : 'down');
-                }
-            });
+                if (dir) element.classList.add(dir);
+                element._lastDir = dir;
+            }
         }
 
         // Base prices for % change calculation
         let esBasePrice = null;
         let btcBasePrice = null;
+        let esBaseScale = 0;  // 100 / esBasePrice
+        let btcBaseScale = 0;  // 100 / btcBasePrice
+        function setEsBasePrice(base) {
+            esBasePrice = base;
+            esBaseScale = base ? 100 / base : 0;
+        }
+        function setBtcBasePrice(base) {
+            btcBasePrice = base;
+            btcBaseScale = base ? 100 / base : 0;
+        }
         function applyEsAnchor(mode) {
             esAnchorMode = mode;
             esAnchorTs = computeAnchorTimestamp(mode);
             const base = findBasePrice(esData, esAnchorTs);
             if (base != null && isFinite(base)) {
-                esBasePrice = base;
-                overlayEsBase = base;
+                setEsBasePrice(base);
+                setOverlayEsBase(base);
             } else if (esData.length > 0) {
-                esBasePrice = esData[0].close;
-                overlayEsBase = esBasePrice;
+                setEsBasePrice(esData.closeAt(0));
+                setOverlayEsBase(esBasePrice);
             }
             // Recompute overlay and header % after base change
             updatePctChange();
-            updateOverlayChart();
+            scheduleOverlayChart();
             // Toggle button states
-            document.getElementById('anchor-globex')?.classList.toggle('active', esAnchorMode === ANCHOR_MODES.GLOBEX);
-            document.getElementById('anchor-cash')?.classList.toggle('active', esAnchorMode === ANCHOR_MODES.CASH);
+            dom.anchorGlobex?.classList.toggle('active', esAnchorMode === ANCHOR_MODES.GLOBEX);
+            dom.anchorCash?.classList.toggle('active', esAnchorMode === ANCHOR_MODES.CASH);
         }
         function refreshAnchorIfNeeded() {
             const newAnchor = computeAnchorTimestamp(esAnchorMode);
@@ -2137,79 +2877,92 @@ class LiveDashboardServer:
         }
         setInterval(refreshAnchorIfNeeded, 60 * 1000);  // check every minute
 
-        // Update % change display
+        // Update % change display (rendered with the next frame's batched DOM writes)
         function updatePctChange() {
+            scheduleUpdate('pct-change', renderPctChange);
+        }
+        // Header % cells: a sideways market leaves the text and class untouched
+        function renderPctCell(el, pct) {
+            if (!el || !hundredthsChanged(el, pct)) return;
+            const up = pct >= 0;
+            setText(el, signedPct(pct, up));
+            setClassName(el, up ? 'price-pct up' : 'price-pct down');
+        }
+        function renderPctChange() {
             if (esBasePrice && lastEsPrice) {
-                const pct = ((lastEsPrice - esBasePrice) / esBasePrice) * 100;
-                const el = document.getElementById('es-pct');
-                el.textContent = (pct >= 0 ? '+' : '') + pct.toFixed(2) + '%';
-                el.className = 'price-pct ' + (pct >= 0 ? 'up' : 'down');
+                renderPctCell(dom.esPct, (lastEsPrice - esBasePrice) * esBaseScale);
             }
             if (btcBasePrice && lastBtcPrice) {
-                const pct = ((lastBtcPrice - btcBasePrice) / btcBasePrice) * 100;
-                const el = document.getElementById('btc-pct');
-                el.textContent = (pct >= 0 ? '+' : '') + pct.toFixed(2) + '%';
-                el.className = 'price-pct ' + (pct >= 0 ? 'up' : 'down');
+                renderPctCell(dom.btcPct, (lastBtcPrice - btcBasePrice) * btcBaseScale);
+            }
+        }
+
+        function pushEsHourBar() {
+            try { esHistSeries.update(currentEsHourBar); } catch (e) { chartWarn('hourly es update failed', { error: e?.message }); }
+        }
+        function pushBtcHourBar() {
+            try { btcHistSeries.update(currentBtcHourBar); } catch (e) { chartWarn('hourly btc update failed', { error: e?.message }); }
+        }
+        // Hourly candles barely move tick-to-tick: fold every tick, repaint at most every 10s
+        // (trailing call so the last tick before a quiet spell still lands)
+        const HOURLY_REPAINT_MS = 10000;
+        const repaintEsHourBar = throttle(pushEsHourBar, HOURLY_REPAINT_MS);
+        const repaintBtcHourBar = throttle(pushBtcHourBar, HOURLY_REPAINT_MS);
+
+        // Lower-bound index of time t in a time-sorted bar array
+        function findBarByTime(arr, t) {
+            let lo = 0, hi = arr.length;
+            while (lo < hi) {
+                const mid = (lo + hi) >>> 1;
+                if (arr[mid].time < t) lo = mid + 1;
+                else hi = mid;
             }
+            return lo;
+        }
+
+        // Fold a tick into the bar for `hour`, located by time rather than assumed to be the tail.
+        // Returns null when the hour is behind the chart's last bar (clock drift / late tick).
+        // The live hour bar *is* the tail element of histData and is mutated in place, so ticks
+        // allocate nothing and no snapshot is needed; a new bar is created once per hour, with
+        // the same key order as the server's bar dicts so histData stays one hidden class.
+        function foldHourBar(histData, bar, hour, price, high, low) {
+            if (!bar || bar.time !== hour) {
+                const idx = findBarByTime(histData, hour);
+                if (idx === histData.length) {
+                    const prev = histData[idx - 1];
+                    if (!prev || prev.close == null) return null;
+                    bar = { time: hour, open: prev.close, high: high, low: low, close: price, volume: 0 };
+                    histData.push(bar);
+                    return bar;
+                }
+                if (idx !== histData.length - 1 || histData[idx].time !== hour) return null;
+                bar = histData[idx];  // server already sent this hour - extend it
+            }
+            if (high > bar.high) bar.high = high;
+            if (low < bar.low) bar.low = low;
+            bar.close = price;
+            return bar;
         }
 
         // Update historical (hourly) charts with live tick data
-        function updateHourlyBar(symbol, price) {
+        // `hour` is the current hour boundary (unix seconds), computed once per frame by the caller
+        function updateHourlyBar(symbol, hour, price, high = price, low = price) {
             try {
                 if (price == null || !isFinite(price)) return;
-
-                const now = Math.floor(Date.now() / 1000 / 3600) * 3600;  // Current hour boundary
+                if (isAnyInteraction()) return;
 
                 if (symbol === 'ES') {
                     if (esHistData.length === 0) return;
-                    if (isAnyInteraction()) return;
-
-                    const lastBar = esHistData[esHistData.length - 1];
-                    if (!lastBar || lastBar.close == null) return;
-
-                    if (!currentEsHourBar || currentEsHourBar.time !== now) {
-                        currentEsHourBar = {
-                            time: now,
-                            open: lastBar.close,
-                            high: price,
-                            low: price,
-                            close: price,
-                            volume: 0
-                        };
-                        if (lastBar.time < now) {
-                            esHistData.push(currentEsHourBar);
-                        }
-                    } else {
-                        currentEsHourBar.high = Math.max(currentEsHourBar.high, price);
-                        currentEsHourBar.low = Math.min(currentEsHourBar.low, price);
-                        currentEsHourBar.close = price;
-                    }
-                    throttledChartOp('hourly-es', 50, () => { esHistSeries.update(currentEsHourBar); });
+                    const bar = foldHourBar(esHistData, currentEsHourBar, hour, price, high, low);
+                    if (!bar) return;
+                    currentEsHourBar = bar;
+                    repaintEsHourBar();
                 } else if (symbol === 'BTC') {
                     if (btcHistData.length === 0) return;
-                    if (isAnyInteraction()) return;
-
-                    const lastBar = btcHistData[btcHistData.length - 1];
-                    if (!lastBar || lastBar.close == null) return;
-
-                    if (!currentBtcHourBar || currentBtcHourBar.time !== now) {
-                        currentBtcHourBar = {
-                            time: now,
-                            open: lastBar.close,
-                            high: price,
-                            low: price,
-                            close: price,
-                            volume: 0
-                        };
-                        if (lastBar.time < now) {
-                            btcHistData.push(currentBtcHourBar);
-                        }
-                    } else {
-                        currentBtcHourBar.high = Math.max(currentBtcHourBar.high, price);
-                        currentBtcHourBar.low = Math.min(currentBtcHourBar.low, price);
-                        currentBtcHourBar.close = price;
-                    }
-                    throttledChartOp('hourly-btc', 50, () => { btcHistSeries.update(currentBtcHourBar); });
+                    const bar = foldHourBar(btcHistData, currentBtcHourBar, hour, price, high, low);
+                    if (!bar) return;
+                    currentBtcHourBar = bar;
+                    repaintBtcHourBar();
                 }
             } catch (e) {
                 // Silently ignore hourly bar update errors
@@ -2217,28 +2970,32 @@ class LiveDashboardServer:
         }
 
         // Update correlation display from server data (COMPACT VERSION)
-        function updateCorrelationDisplay(data) {
-            // Color mapping
-            function getColor(corr) {
-                const abs = Math.abs(corr);
-                if (abs > 0.7) return '#00C853';  // Green - strong
-                if (abs > 0.4) return '#FFD600';  // Yellow - moderate
-                if (abs > 0.2) return '#42A5F5';  // Blue - weak
-                return '#FF1744';  // Red - divergence
-            }
+        // Correlation strength colors, indexed by how many thresholds |r| clears
+        // (0.2 / 0.4 / 0.7): red divergence, blue weak, yellow moderate, green strong
+        const CORR_COLORS = ['#FF1744', '#42A5F5', '#FFD600', '#00C853'];
+        const CORR_TIMEFRAMES = ['1m', '5m', '15m', '1h'];
+        const lastCorrBucket = {};
 
+        function corrBucket(corr) {
+            const abs = Math.abs(corr);
+            return (abs > 0.2) + (abs > 0.4) + (abs > 0.7);
+        }
+
+        function updateCorrelationDisplay(data) {
             // Update each timeframe in compact header
-            const timeframes = ['1m', '5m', '15m', '1h'];
-            timeframes.forEach(tf => {
-                if (data[tf]) {
-                    const el = document.getElementById('corr-' + tf);
-                    if (el) {
-                        const corr = data[tf].correlation;
-                        el.textContent = corr.toFixed(2);
-                        el.style.color = getColor(corr);
+            for (const tf of CORR_TIMEFRAMES) {
+                if (!data[tf]) continue;
+                const el = dom.corr[tf];
+                if (el) {
+                    const corr = data[tf].correlation;
+                    setFixed2(el, corr);
+                    const bucket = corrBucket(corr);
+                    if (bucket !== lastCorrBucket[tf]) {  // skip no-op style invalidation
+                        el.style.color = CORR_COLORS[bucket];
+                        lastCorrBucket[tf] = bucket;
                     }
                 }
-            });
+            }
 
             // Update lead/lag display - use the strongest timeframe
             const bestTf = data['1h'] && Math.abs(data['1h'].correlation) > 0.5 ? '1h' : '1m';
@@ -2246,15 +3003,15 @@ class LiveDashboardServer:
                 const leadLag = data[bestTf].lead_lag;
                 const leader = data[bestTf].leader;
 
-                const valueEl = document.getElementById('lead-lag-value');
+                const valueEl = dom.leadLag;
                 if (valueEl) {
                     if (Math.abs(leadLag) < 1) {
-                        valueEl.textContent = 'SYNC';
-                        valueEl.style.color = '#787b86';
+                        setText(valueEl, 'SYNC');
+                        setColor(valueEl, '#787b86');
                     } else {
                         const unit = bestTf === '1h' ? 'h' : 'm';
-                        valueEl.textContent = `${leader}+${Math.abs(leadLag)}${unit}`;
-                        valueEl.style.color = leader === 'ES' ? '#26a69a' : '#42A5F5';
+                        setText(valueEl, `${leader}+${Math.abs(leadLag)}${unit}`);
+                        setColor(valueEl, leader === 'ES' ? '#26a69a' : '#42A5F5');
                     }
                 }
             }
@@ -2264,70 +3021,192 @@ class LiveDashboardServer:
         }
 
         // Generate actionable trading signal (COMPACT)
-        function updateTradingSignal(data) {
-            const signalEl = document.getElementById('trading-signal');
-            const signalBox = document.getElementById('signal-box');
-
-            if (!signalEl) return;
+        // Signal label -> [color, highlight box]; the logic below only picks a label
+        const SIGNAL_STYLES = {
+            'WAIT': ['#787b86', false],
+            'ES UP?': ['#00C853', true],
+            'ES DN?': ['#ef5350', true],
+            'BTC UP?': ['#00C853', true],
+            'BTC DN?': ['#ef5350', true],
+            'SYNC': ['#00C853', false],
+            'DIVG': ['#FF1744', false],
+            'NEUT': ['#787b86', false],
+        };
 
-            if (!data['1h'] || !lastEsPrice || !lastBtcPrice) {
-                signalEl.textContent = 'WAIT';
-                signalEl.style.color = '#787b86';
-                return;
-            }
+        function pickTradingSignal(data) {
+            if (!data['1h'] || !lastEsPrice || !lastBtcPrice) return 'WAIT';
 
             const hourlyCorr = data['1h'].correlation;
 
             // Calculate recent moves (last 5 bars)
             const esMove = esData.length >= 6 ?
-                ((esData[esData.length-1].close - esData[esData.length-6].close) / esData[esData.length-6].close) * 100 : 0;
+                ((esData.closeAt(-1) - esData.closeAt(-6)) / esData.closeAt(-6)) * 100 : 0;
             const btcMove = btcData.length >= 6 ?
-                ((btcData[btcData.length-1].close - btcData[btcData.length-6].close) / btcData[btcData.length-6].close) * 100 : 0;
+                ((btcData.closeAt(-1) - btcData.closeAt(-6)) / btcData.closeAt(-6)) * 100 : 0;
 
             // Trading logic based on correlation
             if (Math.abs(hourlyCorr) > 0.7) {
                 // Strong correlation - expect them to move together
                 if (Math.abs(btcMove) > 0.3 && Math.abs(esMove) < 0.1) {
-                    signalEl.textContent = btcMove > 0 ? 'ES UP?' : 'ES DN?';
-                    signalEl.style.color = btcMove > 0 ? '#00C853' : '#ef5350';
-                    if (signalBox) signalBox.classList.add('highlight');
+                    return btcMove > 0 ? 'ES UP?' : 'ES DN?';
                 } else if (Math.abs(esMove) > 0.1 && Math.abs(btcMove) < 0.3) {
-                    signalEl.textContent = esMove > 0 ? 'BTC UP?' : 'BTC DN?';
-                    signalEl.style.color = esMove > 0 ? '#00C853' : '#ef5350';
-                    if (signalBox) signalBox.classList.add('highlight');
-                } else {
-                    signalEl.textContent = 'SYNC';
-                    signalEl.style.color = '#00C853';
-                    if (signalBox) signalBox.classList.remove('highlight');
+                    return esMove > 0 ? 'BTC UP?' : 'BTC DN?';
                 }
+                return 'SYNC';
             } else if (Math.abs(hourlyCorr) < 0.2) {
-                signalEl.textContent = 'DIVG';
-                signalEl.style.color = '#FF1744';
-                if (signalBox) signalBox.classList.remove('highlight');
+                return 'DIVG';
+            }
+            return 'NEUT';
+        }
+
+        function updateTradingSignal(data) {
+            const signalEl = dom.signal;
+            if (!signalEl) return;
+
+            const signal = pickTradingSignal(data);
+            if (signalEl._lastText === signal) return;  // style follows the label
+            const [color, highlight] = SIGNAL_STYLES[signal];
+            setText(signalEl, signal);
+            setColor(signalEl, color);
+            // WAIT leaves the box as it was
+            if (dom.signalBox && signal !== 'WAIT') dom.signalBox.classList.toggle('highlight', highlight);
+        }
+
+        // Completed bar - add to immutable array
+        function applyCompletedBar(symbol, bar) {
+            if (symbol === 'ES') {
+                commitBar('ES', esRtSeries, esData, bar, currentEsBar);
+                updatePrice(dom.esPrice, bar.close, lastEsPrice);
+                lastEsPrice = bar.close;
+                // Reset current bar tracking unless ticks already opened the next minute
+                if (currentEsBar && currentEsBar.time <= bar.time) currentEsBar = null;
+            } else if (symbol === 'BTC') {
+                commitBar('BTC', btcRtSeries, btcData, bar, currentBtcBar);
+                refreshOverlayBtcFirst();
+                updatePrice(dom.btcPrice, bar.close, lastBtcPrice);
+                lastBtcPrice = bar.close;
+                if (currentBtcBar && currentBtcBar.time <= bar.time) currentBtcBar = null;
             } else {
-                signalEl.textContent = 'NEUT';
-                signalEl.style.color = '#787b86';
-                if (signalBox) signalBox.classList.remove('highlight');
+                return;
             }
+            // Update overlay and % change on bar completion
+            updatePctChange();
+            appendOverlayBar(symbol, bar);
         }
 
         // WebSocket connection
+        const utf8Decoder = new TextDecoder();
+        const TICK_SYMBOLS = ['ES', 'BTC'];  // index = symbol code in tick frames
+        const TICK_FRAME_TAG = 0x54;  // 'T': binary tick batch (see _pack_tick_frame)
+
+        // Binary tick batch: typed-array views straight over the frame - no parse, no per-tick objects
+        function applyTickFrame(buf) {
+            const n = new DataView(buf).getUint32(4, true);
+            const prices = new Float64Array(buf, 8, n);
+            const times = new Float64Array(buf, 8 + 8 * n, n);
+            const syms = new Uint8Array(buf, 8 + 16 * n, n);
+            const receiveTime = Date.now();
+            tickCount += n;
+
+            for (let i = 0; i < n; i++) {
+                // Calculate latency
+                const ts = times[i];
+                if (ts) {
+                    const latency = receiveTime - ts;
+                    if (latency > 0 && latency < 5000) {
+                        latencySum += latency;
+                        latencyCount++;
+                    }
+                }
+                queueTick(TICK_SYMBOLS[syms[i]], prices[i]);
+            }
+        }
+
+        // Large frames are zlib-deflated once on the server (0x78 header; plain JSON starts with '{').
+        // A burst tick batch inflates back to a binary tick frame; anything else is JSON text
+        function inflateFrame(bytes) {
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('deflate'));
+            return new Response(stream).arrayBuffer().then((buf) =>
+                new Uint8Array(buf, 0, 1)[0] === TICK_FRAME_TAG ? buf : utf8Decoder.decode(buf));
+        }
+
+        // JSON text or a tick frame buffer (a promise of either for deflated frames)
+        function decodeFrame(data) {
+            if (typeof data === 'string') return data;
+            const bytes = new Uint8Array(data);
+            if (bytes[0] === TICK_FRAME_TAG) return data;
+            return bytes[0] === 0x78 ? inflateFrame(bytes) : utf8Decoder.decode(bytes);
+        }
+
+        // Reconnect with capped exponential backoff plus jitter, so a server restart doesn't
+        // bring every open dashboard back in the same instant
+        const RECONNECT_BASE_MS = 500;
+        const RECONNECT_MAX_MS = 30000;
+        // The client pings every HEARTBEAT_MS and the server answers with a pong frame; a socket
+        // that has delivered nothing for STALL_MS is treated as dead rather than waiting for TCP
+        const HEARTBEAT_MS = 15000;
+        const STALL_MS = 35000;
+        let reconnectAttempt = 0;
+
+        function scheduleReconnect() {
+            const base = Math.min(RECONNECT_MAX_MS, RECONNECT_BASE_MS * 2 ** reconnectAttempt);
+            reconnectAttempt = Math.min(reconnectAttempt + 1, 10);
+            setTimeout(connect, base + Math.random() * base * 0.3);
+        }
+
         function connect() {
             const ws = new WebSocket('ws://' + window.location.host + '/ws');
+            ws.binaryType = 'arraybuffer';  // broadcasts arrive as binary UTF-8 JSON
+            let lastFrameAt = performance.now();
+            let heartbeat = null;
 
             ws.onopen = () => {
-                document.getElementById('status-dot').classList.add('connected');
+                reconnectAttempt = 0;
+                lastFrameAt = performance.now();
+                dom.statusDot.classList.add('connected');
+                heartbeat = setInterval(() => {
+                    if (performance.now() - lastFrameAt > STALL_MS) {
+                        // Don't wait on a close handshake the dead peer will never answer
+                        ws.onclose = null;
+                        ws.close();
+                        disconnected();
+                    } else if (ws.readyState === WebSocket.OPEN) {
+                        ws.send('ping');
+                    }
+                }, HEARTBEAT_MS);
             };
 
-            ws.onclose = () => {
-                document.getElementById('status-dot').classList.remove('connected');
-                setTimeout(connect, 2000);
+            const disconnected = () => {
+                clearInterval(heartbeat);
+                dom.statusDot.classList.remove('connected');
+                scheduleReconnect();
             };
+            ws.onclose = disconnected;
 
+            // While a deflated frame is inflating, later frames queue behind it to keep order
+            let inflating = null;
             ws.onmessage = (event) => {
+                lastFrameAt = performance.now();
+                const frame = decodeFrame(event.data);
+                if (!(frame instanceof Promise) && !inflating) {
+                    handleFrame(frame);
+                    return;
+                }
+                const pending = inflating = (inflating || Promise.resolve())
+                    .then(() => frame)
+                    .then(handleFrame, (e) => console.warn('Failed to inflate message:', e))
+                    .finally(() => { if (inflating === pending) inflating = null; });
+                return pending;
+            };
+
+            const handleFrame = (text) => {
+                if (typeof text !== 'string') {
+                    applyTickFrame(text);
+                    return;
+                }
                 let msg;
                 try {
-                    msg = JSON.parse(event.data);
+                    msg = JSON.parse(text);
                 } catch (e) {
                     console.warn('Failed to parse message:', e);
                     return;
@@ -2335,49 +3214,39 @@ class LiveDashboardServer:
 
                 if (msg.type === 'init') {
                     // Set contract
-                    const esContractEl = document.getElementById('es-contract');
-                    if (esContractEl && msg.es_contract) esContractEl.textContent = msg.es_contract;
+                    if (msg.es_contract) setText(dom.esContract, msg.es_contract);
 
                     // Load backfill data (COMPLETED bars only)
                     if (msg.es_backfill && msg.es_backfill.length) {
-                        esData = msg.es_backfill;
-                        try { esRtSeries.setData(esData); } catch(e) {}
-                        lastEsPrice = esData[esData.length - 1].close;
-                        updatePrice(document.getElementById('es-price'), lastEsPrice, null);
+                        esData.reset(msg.es_backfill);
+                        try { esRtSeries.setData(msg.es_backfill); } catch(e) {}
+                        lastEsPrice = esData.at(-1).close;
+                        updatePrice(dom.esPrice, lastEsPrice, null);
                     }
                     if (msg.btc_backfill && msg.btc_backfill.length) {
-                        btcData = msg.btc_backfill;
-                        try { btcRtSeries.setData(btcData); } catch(e) {}
-                        lastBtcPrice = btcData[btcData.length - 1].close;
-                        btcBasePrice = btcData[0].close;  // Set base for % change
-                        updatePrice(document.getElementById('btc-price'), lastBtcPrice, null);
-                    }
-
-                    // Load historical
-                    if (msg.es_historical && msg.es_historical.length) {
-                        esHistData = msg.es_historical;
-                        try { esHistSeries.setData(esHistData); } catch(e) {}
-                    }
-                    if (msg.btc_historical && msg.btc_historical.length) {
-                        btcHistData = msg.btc_historical;
-                        try { btcHistSeries.setData(btcHistData); } catch(e) {}
+                        btcData.reset(msg.btc_backfill);
+                        refreshOverlayBtcFirst();
+                        try { btcRtSeries.setData(msg.btc_backfill); } catch(e) {}
+                        lastBtcPrice = btcData.at(-1).close;
+                        setBtcBasePrice(btcData.closeAt(0));  // Set base for % change
+                        updatePrice(dom.btcPrice, lastBtcPrice, null);
                     }
 
                     // Anchor base prices (ES uses session anchor, BTC uses first bar)
                     if (btcData.length > 0) {
-                        btcBasePrice = btcData[0].close;
+                        setBtcBasePrice(btcData.closeAt(0));
                     }
                     if (esData.length > 0) {
                         // Ensure ES base price is initialized (was missing)
-                        esBasePrice = esData[0].close;
+                        setEsBasePrice(esData.closeAt(0));
                         applyEsAnchor(esAnchorMode);
                     }
 
                     // Update % change display
                     updatePctChange();
 
-                    // Update TradingView-style overlay chart
-                    updateOverlayChart();
+                    // Update TradingView-style overlay chart (history replaced - redraw all)
+                    scheduleOverlayChart(true);
 
                     // Update correlation display if provided
                     if (msg.correlation) {
@@ -2387,97 +3256,31 @@ class LiveDashboardServer:
                     // Register crosshair sync NOW that data is loaded
                     registerCrosshairSync();
                 }
-                else if (msg.type === 'bar') {
-                    // Completed bar - add to immutable array
-                    const bar = msg.data;
-                    if (msg.symbol === 'ES') {
-                        esData.push(bar);
-                        if (esData.length > 1440) esData.shift();
-                        try { esRtSeries.setData(esData); } catch(e) {}  // Reset data to ensure clean state
-                        updatePrice(document.getElementById('es-price'), bar.close, lastEsPrice);
-                        lastEsPrice = bar.close;
-                        currentEsBar = null;  // Reset current bar tracking
-                    } else if (msg.symbol === 'BTC') {
-                        btcData.push(bar);
-                        if (btcData.length > 1440) btcData.shift();
-                        try { btcRtSeries.setData(btcData); } catch(e) {}  // Reset data to ensure clean state
-                        updatePrice(document.getElementById('btc-price'), bar.close, lastBtcPrice);
-                        lastBtcPrice = bar.close;
-                        currentBtcBar = null;  // Reset current bar tracking
+                else if (msg.type === 'historical') {
+                    // Hourly history: its own frame right after init, so the realtime
+                    // charts paint before this is parsed
+                    if (msg.es_historical && msg.es_historical.length) {
+                        esHistData = msg.es_historical;
+                        currentEsHourBar = null;  // re-locate the live hour in the new history
+                        try { esHistSeries.setData(esHistData); } catch(e) {}
                     }
-                    // Update overlay and % change on bar completion
-                    updatePctChange();
-                    updateOverlayChart();
-                }
-                else if (msg.type === 'ticks') {
-                    // BATCHED TICKS: Process multiple ticks efficiently
-                    const now = Math.floor(Date.now() / 1000 / 60) * 60;
-                    const receiveTime = Date.now();
-
-                    for (const tick of msg.data) {
-                        tickCount++;
-                        const symbol = tick.s;
-                        const price = tick.p;
-                        const ts = tick.t;
-
-                        // Calculate latency
-                        if (ts) {
-                            const latency = receiveTime - ts;
-                            if (latency > 0 && latency < 5000) {
-                                latencySum += latency;
-                                latencyCount++;
-                            }
-                        }
-
-                        if (symbol === 'BTC') {
-                            updatePrice(document.getElementById('btc-price'), price, lastBtcPrice);
-                            lastBtcPrice = price;
-
-                            if (!currentBtcBar || currentBtcBar.time !== now) {
-                                const lastComplete = btcData.length > 0 ? btcData[btcData.length - 1] : null;
-                                currentBtcBar = {
-                                    time: now,
-                                    open: lastComplete ? lastComplete.close : price,
-                                    high: price, low: price, close: price
-                                };
-                            } else {
-                                currentBtcBar.high = Math.max(currentBtcBar.high, price);
-                                currentBtcBar.low = Math.min(currentBtcBar.low, price);
-                                currentBtcBar.close = price;
-                        }
-                        throttledChartOp('batch-btc', 30, () => { btcRtSeries.update(currentBtcBar); });
-                        updateHourlyBar('BTC', price);
-                        updateOverlayTick('BTC', price);  // Update overlay chart
-                    } else if (symbol === 'ES') {
-                            updatePrice(document.getElementById('es-price'), price, lastEsPrice);
-                            lastEsPrice = price;
-                            if (esBasePrice == null && esData.length > 0) {
-                                esBasePrice = esData[0].close;
-                            }
-
-                            if (!currentEsBar || currentEsBar.time !== now) {
-                                const lastComplete = esData.length > 0 ? esData[esData.length - 1] : null;
-                                currentEsBar = {
-                                    time: now,
-                                    open: lastComplete ? lastComplete.close : price,
-                                    high: price, low: price, close: price
-                                };
-                            } else {
-                                currentEsBar.high = Math.max(currentEsBar.high, price);
-                                currentEsBar.low = Math.min(currentEsBar.low, price);
-                                currentEsBar.close = price;
-                            }
-                        throttledChartOp('batch-es', 30, () => { esRtSeries.update(currentEsBar); });
-                        updateHourlyBar('ES', price);
-                        updateOverlayTick('ES', price);  // Update overlay chart
+                    if (msg.btc_historical && msg.btc_historical.length) {
+                        btcHistData = msg.btc_historical;
+                        currentBtcHourBar = null;  // re-locate the live hour in the new history
+                        try { btcHistSeries.setData(btcHistData); } catch(e) {}
                     }
+                }
+                else if (msg.type === 'bars') {
+                    // Completed bars (ES and/or BTC closing in the same server loop turn)
+                    for (const entry of msg.data) applyCompletedBar(entry.symbol, entry.bar);
+                    // Correlation recomputed for these bars rides along in the same frame
+                    if (msg.correlation) {
+                        updateCorrelationDisplay(msg.correlation);
                     }
-                    updatePctChange();
                 }
                 else if (msg.type === 'tick') {
                     // LEGACY: Single tick (for backwards compatibility)
                     tickCount++;
-                    const now = Math.floor(Date.now() / 1000 / 60) * 60;
                     const receiveTime = Date.now();
 
                     if (msg.ts) {
@@ -2487,50 +3290,7 @@ class LiveDashboardServer:
                             latencyCount++;
                         }
                     }
-
-                    if (msg.symbol === 'BTC') {
-                        updatePrice(document.getElementById('btc-price'), msg.price, lastBtcPrice);
-                        lastBtcPrice = msg.price;
-
-                        if (!currentBtcBar || currentBtcBar.time !== now) {
-                            const lastComplete = btcData.length > 0 ? btcData[btcData.length - 1] : null;
-                            currentBtcBar = {
-                                time: now,
-                                open: lastComplete ? lastComplete.close : msg.price,
-                                high: msg.price, low: msg.price, close: msg.price
-                            };
-                        } else {
-                            currentBtcBar.high = Math.max(currentBtcBar.high, msg.price);
-                            currentBtcBar.low = Math.min(currentBtcBar.low, msg.price);
-                            currentBtcBar.close = msg.price;
-                        }
-                        throttledChartOp('rt-btc', 30, () => { btcRtSeries.update(currentBtcBar); });
-                        updateHourlyBar('BTC', msg.price);
-                        updateOverlayTick('BTC', msg.price);  // Update overlay chart
-                    } else if (msg.symbol === 'ES') {
-                        updatePrice(document.getElementById('es-price'), msg.price, lastEsPrice);
-                        lastEsPrice = msg.price;
-                        if (esBasePrice == null && esData.length > 0) {
-                            esBasePrice = esData[0].close;
-                        }
-
-                        if (!currentEsBar || currentEsBar.time !== now) {
-                            const lastComplete = esData.length > 0 ? esData[esData.length - 1] : null;
-                            currentEsBar = {
-                                time: now,
-                                open: lastComplete ? lastComplete.close : msg.price,
-                                high: msg.price, low: msg.price, close: msg.price
-                            };
-                        } else {
-                            currentEsBar.high = Math.max(currentEsBar.high, msg.price);
-                            currentEsBar.low = Math.min(currentEsBar.low, msg.price);
-                            currentEsBar.close = msg.price;
-                        }
-                        throttledChartOp('rt-es', 30, () => { esRtSeries.update(currentEsBar); });
-                        updateHourlyBar('ES', msg.price);
-                        updateOverlayTick('ES', msg.price);  // Update overlay chart
-                    }
-                    updatePctChange();
+                    queueTick(msg.symbol, msg.price);
                 }
                 else if (msg.type === 'correlation') {
                     // Update correlation display with server-calculated values
@@ -2539,18 +3299,24 @@ class LiveDashboardServer:
             };
         }
 
-        // Resize handler - use RAF for smooth resize
-        let resizeRaf = null;
+        // Resize handler - coalesce resize bursts into one RAF pass
+        let resizeRaf = 0;
         window.addEventListener('resize', () => {
-            if (resizeRaf) cancelAnimationFrame(resizeRaf);
+            if (resizeRaf) return;  // already scheduled for this frame
             resizeRaf = requestAnimationFrame(() => {
+                resizeRaf = 0;
                 try {
-                    esRtChart.applyOptions({ width: document.getElementById('es-realtime').offsetWidth });
-                    btcRtChart.applyOptions({ width: document.getElementById('btc-realtime').offsetWidth });
-                    esHistChart.applyOptions({ width: document.getElementById('es-historical').offsetWidth });
-                    btcHistChart.applyOptions({ width: document.getElementById('btc-historical').offsetWidth });
+                    // Read all widths first, then write, so applyOptions doesn't force reflow between reads
+                    const esRtWidth = dom.esRealtime.offsetWidth;
+                    const btcRtWidth = dom.btcRealtime.offsetWidth;
+                    const esHistWidth = dom.esHistorical.offsetWidth;
+                    const btcHistWidth = dom.btcHistorical.offsetWidth;
                     // CRITICAL: Both overlay charts must have SAME width for alignment
-                    const overlayWidth = document.getElementById('overlay-main-chart').offsetWidth;
+                    const overlayWidth = overlayChartEl.offsetWidth;
+                    esRtChart.applyOptions({ width: esRtWidth });
+                    btcRtChart.applyOptions({ width: btcRtWidth });
+                    esHistChart.applyOptions({ width: esHistWidth });
+                    btcHistChart.applyOptions({ width: btcHistWidth });
                     overlayChart.applyOptions({ width: overlayWidth });
                     overlayVolChart.applyOptions({ width: overlayWidth });
                     // Re-sync after resize
@@ -2567,18 +3333,8 @@ class LiveDashboardServer:
 </body>
 </html>'''
 
-        output_dir = Path(__file__).parent.parent / 'output'
-        output_dir.mkdir(exist_ok=True)
-
-        with open(output_dir / 'live_dashboard.html', 'w', encoding='utf-8') as f:
-            f.write(html)
-
-        print(f"[OK] Generated live dashboard")
-
-    def _generate_micro_html(self):
-        """Generate a slim microstructure-focused dashboard (remove historical panes)."""
-        # Reuse the main HTML and strip historical sections after load.
-        html = '''<!DOCTYPE html>
+# Micro view: reuses the main HTML and strips historical sections after load.
+_MICRO_HTML = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -2609,14 +3365,9 @@ class LiveDashboardServer:
     </script>
 </body>
 </html>'''
+_MICRO_HTML_BYTES = _MICRO_HTML.encode('utf-8')
+_MICRO_HTML_ETAG = _html_etag(_MICRO_HTML_BYTES)
 
-        output_dir = Path(__file__).parent.parent / 'output'
-        output_dir.mkdir(exist_ok=True)
-
-        with open(output_dir / 'micro_dashboard.html', 'w', encoding='utf-8') as f:
-            f.write(html)
-
-        print(f"[OK] Generated micro dashboard")
 
 async def main():
     server = LiveDashboardServer()
@@ -2624,4 +3375,8 @@ async def main():
 
 
 if __name__ == '__main__':
+    # Stays on the stdlib loop: data_sources calls ib_insync's util.patchAsyncio()
+    # (nest_asyncio), which only patches asyncio.BaseEventLoop, and the blocking
+    # IB calls made from inside run() need that re-entrancy - uvloop.Loop can't
+    # provide it
     asyncio.run(main())
@@ -0,0 +1,88 @@
+"""Regression tests for correlation analysis helpers."""
+import numpy as np
+import pandas as pd
+
+from src.analysis import (
+    MultiTimeframeAnalysis,
+    _lagged_corr_fft,
+    _lagged_corr_kernel,
+    calculate_divergence,
+    calculate_lead_lag,
+    rolling_correlation,
+)
+
+
+def _reference_rolling_corr(x, y, window):
+    out = []
+    for i in range(len(x) - window + 1):
+        c = np.corrcoef(x[i:i + window], y[i:i + window])[0, 1]
+        out.append(c)
+    return np.array(out)
+
+
+def test_rolling_correlation_matches_corrcoef():
+    rng = np.random.default_rng(7)
+    x = rng.normal(size=300) * 1e-3
+    y = 0.6 * x + rng.normal(size=300) * 1e-3
+    got = rolling_correlation(x, y, 20)
+    expected = _reference_rolling_corr(x, y, 20)
+    assert got.shape == expected.shape
+    assert np.allclose(got, expected, atol=1e-9)
+
+
+def test_rolling_correlation_flat_window_is_nan():
+    x = np.concatenate([np.zeros(30), np.linspace(0, 1, 30)])
+    y = np.linspace(1, 2, 60)
+    corr = rolling_correlation(x, y, 10)
+    assert np.isnan(corr[0])
+    assert np.isfinite(corr[-1])
+
+
+def test_calculate_divergence_bounds():
+    rng = np.random.default_rng(3)
+    es = 6000 + np.cumsum(rng.normal(size=200))
+    btc = 90000 - np.cumsum(rng.normal(size=200) * 10)
+    div = calculate_divergence(es, btc, window=20)
+    assert len(div) == 199 - 20 + 1
+    assert np.all((div >= 0) & (div <= 1))
+
+
+def test_lagged_correlations_match_corrcoef():
+    rng = np.random.default_rng(11)
+    x = rng.normal(size=200)
+    y = np.roll(x, 3) + rng.normal(size=200) * 0.5
+    got = _lagged_corr_kernel(x, y, 10)
+    expected = [np.corrcoef(x[:len(x) - lag], y[lag:])[0, 1] for lag in range(11)]
+    np.testing.assert_allclose(got, expected, atol=1e-10)
+    x_leads, y_leads = _lagged_corr_fft(x, y, 10)
+    np.testing.assert_allclose(x_leads, expected, atol=1e-10)
+    np.testing.assert_allclose(y_leads, _lagged_corr_kernel(y, x, 10), atol=1e-10)
+
+
+def test_lead_lag_detects_btc_following_es():
+    rng = np.random.default_rng(5)
+    es = rng.normal(size=400)
+    btc = np.concatenate((rng.normal(size=4), es[:-4])) + rng.normal(size=400) * 0.3
+    lag, corr = calculate_lead_lag(es, btc)
+    assert lag == 4
+    assert corr > 0.9
+
+
+def test_from_arrays_matches_dataframe_analysis():
+    rng = np.random.default_rng(8)
+    base = pd.Timestamp('2025-01-06', tz='UTC').value
+    es_ts = base + np.sort(rng.choice(1800, 1200, replace=False)) * 60_000_000_000
+    btc_ts = base + np.sort(rng.choice(1800, 1200, replace=False)) * 60_000_000_000
+    es = 6000 + np.cumsum(rng.normal(size=1200))
+    btc = 90000 + np.cumsum(rng.normal(size=1200) * 50)
+
+    def frame(ts, close):
+        return pd.DataFrame({'timestamp': pd.to_datetime(ts, utc=True), 'open': close,
+                             'high': close, 'low': close, 'close': close, 'volume': 1.0})
+
+    expected = MultiTimeframeAnalysis(frame(es_ts, es), frame(btc_ts, btc)).analyze_all()
+    assert MultiTimeframeAnalysis.from_arrays(es_ts, es, btc_ts, btc).analyze_all() == expected
+
+    # Out-of-order input (e.g. a healed gap appended late) is sorted once up front
+    shuffle = rng.permutation(1200)
+    assert MultiTimeframeAnalysis.from_arrays(es_ts[shuffle], es[shuffle], btc_ts, btc).analyze_all() == expected
@@ -0,0 +1,270 @@
+"""Regression tests for WebSocket broadcast fan-out."""
+import asyncio
+import json
+import struct
+import sys
+from datetime import datetime, timezone
+import types
+import zlib
+import numpy as np
+import pytest
+
+# Provide a lightweight ib_insync stub so tests don't require the real dependency.
+if "ib_insync" not in sys.modules:
+    class _DummyIB:
+        def __init__(self, *_, **__): ...
+
+    class _DummyFuture:
+        def __init__(self, *_, **__): ...
+
+    class _DummyUtil:
+        @staticmethod
+        def patchAsyncio():
+            return None
+
+    sys.modules["ib_insync"] = types.SimpleNamespace(IB=_DummyIB, Future=_DummyFuture, util=_DummyUtil())
+
+from src import live_server
+from src.data_sources import OHLCV
+from src.live_server import PONG_FRAME, LiveDashboardServer, _write_if_changed
+
+
+class _FakeClient:
+    def __init__(self):
+        self.sent = []
+        self.closed_with = None
+
+    async def send_bytes(self, message):
+        self.sent.append(message)
+
+    async def close(self, *, code, message=b''):
+        self.closed_with = code
+
+
+def test_broadcast_discards_oldest_frame_when_client_queue_is_full():
+    async def scenario():
+        server = LiveDashboardServer()
+        server.CLIENT_QUEUE_SIZE = 2
+        client = _FakeClient()
+        writer = server._add_client(client)
+        writer.cancel()  # nothing drains the queue, as with a client that can't keep up
+
+        for seq in range(3):
+            await server._broadcast({'type': 'ping', 'seq': seq})
+        queue = server.clients[client]
+        return [json.loads(queue.get_nowait())['seq'] for _ in range(queue.qsize())]
+
+    assert asyncio.run(scenario()) == [1, 2]
+
+
+def test_first_frames_go_out_in_order_before_broadcasts():
+    async def scenario():
+        server = LiveDashboardServer()
+        client = _FakeClient()
+        server._add_client(client, b'init', b'historical')
+        await server._broadcast({'type': 'ping'})
+        await asyncio.sleep(0.01)
+        return client
+
+    client = asyncio.run(scenario())
+    assert client.sent[:2] == [b'init', b'historical']
+    assert len(client.sent) == 3
+
+
+class _DeadClient(_FakeClient):
+    async def send_bytes(self, message):
+        raise ConnectionResetError("gone")
+
+
+class _StuckClient(_FakeClient):
+    async def send_bytes(self, message):
+        await asyncio.sleep(3600)
+
+
+def test_broadcast_prunes_failed_clients_without_blocking_others():
+    async def scenario():
+        server = LiveDashboardServer()
+        server.BROADCAST_SEND_TIMEOUT = 0.05
+        fast, dead, stuck = _FakeClient(), _DeadClient(), _StuckClient()
+        for client in (dead, stuck, fast):
+            server._add_client(client)
+
+        await server._broadcast({'type': 'ping'})
+        await asyncio.sleep(0.1)  # let the writers hit the send timeout and the close task run
+        return server, fast, dead, stuck
+
+    server, fast, dead, stuck = asyncio.run(scenario())
+    assert len(fast.sent) == 1
+    assert list(server.clients) == [fast]
+    assert stuck.closed_with is not None
+
+
+def test_tick_drain_loop_batches_queued_ticks_into_one_frame():
+    async def scenario():
+        server = LiveDashboardServer()
+        server.TICK_BATCH_INTERVAL = 0.01
+        client = _FakeClient()
+        server._add_client(client)
+        server.running = True
+        drain = asyncio.create_task(server._tick_drain_loop())
+        for price in (100.0, 100.25, float('nan'), 100.5):
+            server._queue_tick('ES', price, 0)
+        await asyncio.sleep(0.05)
+        server.running = False
+        drain.cancel()
+        return client
+
+    client = asyncio.run(scenario())
+    assert len(client.sent) == 1
+    frame = client.sent[0]
+    tag, count = struct.unpack_from('<BxxxI', frame)
+    assert (tag, count) == (ord('T'), 3)
+    assert np.frombuffer(frame, '<f8', count, 8).tolist() == [100.0, 100.25, 100.5]
+    assert np.frombuffer(frame, '<f8', count, 8 + 8 * count).tolist() == [0.0, 0.0, 0.0]
+    assert np.frombuffer(frame, np.uint8, count, 8 + 16 * count).tolist() == [0, 0, 0]
+
+
+def test_bars_closing_together_share_one_frame_with_correlation():
+    async def scenario():
+        server = LiveDashboardServer()
+        client = _FakeClient()
+        server._add_client(client)
+        server._compute_correlation = lambda *series: {'1m': {'correlation': 0.5, 'lead_lag': 0}}
+        for minute in range(20):
+            ts = datetime(2025, 1, 6, 14, minute, tzinfo=timezone.utc)
+            server.btc_bar_buffer.append(ts, 1, 1, 1, 1, 1)
+            server.es_bar_buffer.append(ts, 1, 1, 1, 1, 1)
+        bar = OHLCV(datetime(2025, 1, 6, 14, 20, tzinfo=timezone.utc), 1.0, 2.0, 0.5, 1.5, 10.0)
+        server._on_btc_bar(bar)
+        server._on_es_bar(bar)
+        for _ in range(100):  # let the publish task and worker thread finish
+            if client.sent:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+        return client
+
+    client = asyncio.run(scenario())
+    assert len(client.sent) == 1
+    frame = json.loads(client.sent[0])
+    assert frame['type'] == 'bars'
+    assert [entry['symbol'] for entry in frame['data']] == ['BTC', 'ES']
+    assert frame['correlation']['1m']['correlation'] == 0.5
+
+
+def test_correlation_reruns_only_when_both_sides_advance():
+    async def scenario():
+        server = LiveDashboardServer()
+        calls = []
+        server._compute_correlation = lambda *series: calls.append(len(series[1])) or {}
+        for minute in range(20):
+            ts = datetime(2025, 1, 6, 14, minute, tzinfo=timezone.utc)
+            server.btc_bar_buffer.append(ts, 1, 1, 1, 1, 1)
+            server.es_bar_buffer.append(ts, 1, 1, 1, 1, 1)
+        await server._update_correlation()
+        server.btc_bar_buffer.append(datetime(2025, 1, 6, 14, 20, tzinfo=timezone.utc), 1, 1, 1, 1, 1)
+        await server._update_correlation()  # BTC ahead, ES still at 14:19
+        server.es_bar_buffer.append(datetime(2025, 1, 6, 14, 20, tzinfo=timezone.utc), 1, 1, 1, 1, 1)
+        await server._update_correlation()
+        return calls
+
+    assert asyncio.run(scenario()) == [20, 21]
+
+
+def test_large_frames_are_deflated_once_for_all_clients():
+    async def scenario():
+        server = LiveDashboardServer()
+        clients = [_FakeClient(), _FakeClient()]
+        for client in clients:
+            server._add_client(client)
+        await server._broadcast({'type': 'ping'})
+        await server._broadcast({'type': 'correlation', 'data': [{'r': i * 0.001} for i in range(2000)]})
+        await asyncio.sleep(0.01)
+        return clients
+
+    first, second = asyncio.run(scenario())
+    small, large = first.sent
+    assert json.loads(small) == {'type': 'ping'}
+    assert large is second.sent[1]  # same compressed bytes object for every client
+    assert large[0] == 0x78
+    assert json.loads(zlib.decompress(large))['data'][1999] == {'r': 1.999}
+
+
+def test_historical_snapshot_is_deflated_and_cached():
+    server = LiveDashboardServer()
+    server.es_historical = [{'time': 3600 * i, 'close': 6000.25 + i} for i in range(500)]
+    server.btc_historical = [{'time': 3600 * i, 'close': 95000.5 + i} for i in range(500)]
+
+    frame = server._get_historical_payload()
+    assert frame is server._get_historical_payload()
+    assert frame[0] == 0x78
+    data = json.loads(zlib.decompress(frame))
+    assert data['type'] == 'historical'
+    assert data['btc_historical'][499] == {'time': 3600 * 499, 'close': 95499.5}
+
+
+def test_ping_is_answered_through_the_client_queue():
+    async def scenario():
+        server = LiveDashboardServer()
+        client = _FakeClient()
+        server._add_client(client)
+        server._send_pong(client)
+        server._send_pong(_FakeClient())  # unknown socket: ignored
+        await asyncio.sleep(0.01)
+        return client
+
+    assert asyncio.run(scenario()).sent == [PONG_FRAME]
+
+
+def test_dashboard_file_is_only_rewritten_when_its_bytes_change(tmp_path):
+    page = tmp_path / 'live_dashboard.html'
+
+    assert _write_if_changed(page, b'<html>a</html>')
+    mtime = page.stat().st_mtime_ns
+    assert not _write_if_changed(page, b'<html>a</html>')
+    assert page.stat().st_mtime_ns == mtime
+    assert _write_if_changed(page, b'<html>b</html>')
+    assert page.read_bytes() == b'<html>b</html>'
+    assert [p.name for p in tmp_path.iterdir()] == ['live_dashboard.html']
+
+
+def test_burst_tick_batches_are_deflated_once():
+    async def scenario():
+        server = LiveDashboardServer()
+        server.TICK_BATCH_INTERVAL = 0.01
+        clients = [_FakeClient(), _FakeClient()]
+        for client in clients:
+            server._add_client(client)
+        server.running = True
+        drain = asyncio.create_task(server._tick_drain_loop())
+        for i in range(300):
+            server._queue_tick('BTC', 95000 + i * 0.01, 1_760_000_000_000 + i)
+        await asyncio.sleep(0.05)
+        server.running = False
+        drain.cancel()
+        return clients
+
+    first, second = asyncio.run(scenario())
+    assert len(first.sent) == 1 and first.sent[0] is second.sent[0]
+    frame = zlib.decompress(first.sent[0])
+    assert struct.unpack_from('<BxxxI', frame) == (ord('T'), 300)
+    assert np.frombuffer(frame, '<f8', 300, 8)[-1] == 95000 + 299 * 0.01
+
+
+def test_websocket_handler_disables_permessage_deflate(monkeypatch):
+    built = {}
+
+    class _Handshake(Exception):
+        pass
+
+    class _RecordingResponse:
+        def __init__(self, **kwargs):
+            built.update(kwargs)
+
+        async def prepare(self, request):
+            raise _Handshake  # stop before any frames are queued
+
+    monkeypatch.setattr(live_server.web, 'WebSocketResponse', _RecordingResponse)
+    with pytest.raises(_Handshake):
+        asyncio.run(LiveDashboardServer().websocket_handler(None))
+    assert built.get('compress') is False
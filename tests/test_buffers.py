@@ -0,0 +1,99 @@
+"""Regression tests for rolling bar buffers."""
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+import sys
+import types
+
+# Provide a lightweight ib_insync stub so tests don't require the real dependency.
+if "ib_insync" not in sys.modules:
+    class _DummyIB:
+        def __init__(self, *_, **__): ...
+
+    class _DummyFuture:
+        def __init__(self, *_, **__): ...
+
+    class _DummyUtil:
+        @staticmethod
+        def patchAsyncio():
+            return None
+
+    sys.modules["ib_insync"] = types.SimpleNamespace(IB=_DummyIB, Future=_DummyFuture, util=_DummyUtil())
+
+from src.data_sources import BarRing, DataBuffer, OHLCV
+
+
+T0 = datetime(2025, 1, 6, 14, 30, tzinfo=timezone.utc)
+
+
+def _fill(ring: BarRing, count: int):
+    for i in range(count):
+        ring.append(T0 + timedelta(minutes=i), i, i + 1, i - 1, i + 0.5, 10 * i)
+
+
+def test_bar_ring_keeps_order_before_wrap():
+    ring = BarRing(5)
+    _fill(ring, 3)
+    df = ring.to_dataframe()
+
+    assert len(ring) == 3
+    assert df['close'].tolist() == [0.5, 1.5, 2.5]
+    assert df['timestamp'].iloc[0] == T0
+    assert str(df['timestamp'].dt.tz) == 'UTC'
+
+
+def test_bar_ring_evicts_oldest_after_wrap():
+    ring = BarRing(5)
+    _fill(ring, 8)
+    df = ring.to_dataframe()
+
+    assert len(ring) == 5
+    assert df['open'].tolist() == [3, 4, 5, 6, 7]
+    assert df['timestamp'].tolist() == [T0 + timedelta(minutes=i) for i in range(3, 8)]
+
+
+def test_bar_ring_snapshot_is_independent_of_later_writes():
+    ring = BarRing(3)
+    _fill(ring, 3)
+    df = ring.to_dataframe()
+    _fill(ring, 3)
+
+    assert df['close'].tolist() == [0.5, 1.5, 2.5]
+
+
+def test_data_buffer_caps_at_max_bars():
+    buf = DataBuffer(max_bars=3)
+    for i in range(5):
+        buf.add(OHLCV(T0 + timedelta(minutes=i), i, i, i, i, 1.0))
+
+    assert [b.open for b in buf.bars] == [2, 3, 4]
+    assert buf.last.open == 4
+    assert buf.to_dataframe()['open'].tolist() == [2, 3, 4]
+
+
+def test_bar_ring_extend_matches_appends():
+    appended, extended = BarRing(4), BarRing(4)
+    _fill(appended, 2)
+    _fill(extended, 2)
+    ts = np.array([pd.Timestamp(T0 + timedelta(minutes=i)).value for i in range(10, 16)], dtype=np.int64)
+    cols = [np.arange(6, dtype=float) + k for k in range(5)]
+
+    for i in range(6):
+        appended.append(pd.Timestamp(ts[i], tz='UTC'), *(c[i] for c in cols))
+    extended.extend(ts, *cols)
+
+    pd.testing.assert_frame_equal(extended.to_dataframe(), appended.to_dataframe())
+
+
+def test_bar_ring_last_ts_tracks_newest_bar():
+    ring = BarRing(3)
+    assert ring.last_ts is None
+    _fill(ring, 5)
+    assert ring.last_ts == pd.Timestamp(T0 + timedelta(minutes=4)).value
+
+
+def test_bar_ring_append_ns_matches_datetime_append():
+    by_datetime, by_ns = BarRing(3), BarRing(3)
+    by_datetime.append(T0, 1, 2, 0.5, 1.5, 10)
+    by_ns.append_ns(pd.Timestamp(T0).value, 1, 2, 0.5, 1.5, 10)
+    pd.testing.assert_frame_equal(by_ns.to_dataframe(), by_datetime.to_dataframe())
@@ -18,8 +18,8 @@ if "ib_insync" not in sys.modules:
 
     sys.modules["ib_insync"] = types.SimpleNamespace(IB=_DummyIB, Future=_DummyFuture, util=_DummyUtil())
 
-from src.live_server import LiveDashboardServer
-from src.data_sources import OHLCV
+from src.live_server import LiveDashboardServer, _parse_binance_trade
+from src.data_sources import OHLCV, _parse_closed_kline
 import pandas as pd
 
 
@@ -63,3 +63,60 @@ def test_clean_dataframe_drops_nonfinite_rows():
     cleaned = server._clean_dataframe(df)
     assert len(cleaned) == 1
     assert cleaned.iloc[0]["open"] == 1.0
+
+
+def test_parse_binance_trade_fast_path_and_fallback():
+    frame = ('{"e":"trade","E":1700000000123,"s":"BTCUSDT","t":12345,"p":"67890.12000000",'
+             '"q":"0.00100000","T":1700000000120,"m":true,"M":true}')
+    assert _parse_binance_trade(frame) == (67890.12, 1700000000120)
+
+    # Reordered/whitespace variant still parses via the JSON fallback
+    spaced = '{"T": 1700000000120, "p": "67890.12"}'
+    assert _parse_binance_trade(spaced) == (67890.12, 1700000000120)
+
+
+def test_ingest_minute_bars_feeds_chart_and_ring_from_one_pass():
+    server = LiveDashboardServer()
+    ts = pd.to_datetime(['2025-01-06 14:30:05', '2025-01-06 14:31:05'], utc=True)
+    df = pd.DataFrame({'timestamp': ts, 'open': [1.0, 2.0], 'high': [2.0, 3.0],
+                       'low': [0.5, 1.5], 'close': [1.5, 2.5], 'volume': [10, 20]})
+
+    bars = server._ingest_minute_bars(server.es_bar_buffer, df, align=True)
+    assert bars[1] == {'time': 1736173860, 'open': 2.0, 'high': 3.0, 'low': 1.5, 'close': 2.5, 'volume': 20.0}
+    ring_ts, ring_close = server.es_bar_buffer.closes()
+    assert ring_ts.tolist() == [t * 1_000_000_000 for t in (bars[0]['time'], bars[1]['time'])]
+    assert ring_close.tolist() == [1.5, 2.5]
+
+    # Unaligned chart times keep the seconds; the ring is always minute-aligned
+    assert server._ingest_minute_bars(server.btc_bar_buffer, df)[0]['time'] == bars[0]['time'] + 5
+
+
+def test_clean_dataframe_drops_unparseable_and_missing_timestamps():
+    server = LiveDashboardServer()
+    df = pd.DataFrame({
+        'timestamp': pd.to_datetime(['2025-01-06 14:30', None, '2025-01-06 14:32', '2025-01-06 14:33'], utc=True),
+        'open': [1.0, 1.0, 1.0, float('inf')],
+        'close': [1.0, 1.0, 1.0, 1.0],
+        'volume': ['10', 5.0, 'n/a', 1.0],
+    })
+    assert server._clean_dataframe(df).index.tolist() == [0]
+
+
+def test_bar_time_is_the_utc_minute_for_aware_and_naive_timestamps():
+    aware = datetime(2025, 1, 6, 14, 31, 59, 999999, tzinfo=timezone.utc)
+    assert LiveDashboardServer._minute_epoch(aware) == 1736173860
+    assert LiveDashboardServer._minute_epoch(aware.replace(tzinfo=None)) == 1736173860
+
+
+def test_parse_closed_kline_skips_in_progress_and_tolerates_spacing():
+    kline = ('{"e":"kline","E":1700000060001,"s":"BTCUSDT","k":{"t":1700000000000,"T":1700000059999,'
+             '"s":"BTCUSDT","i":"1m","o":"67890.10","c":"67895.50","h":"67900.00","l":"67880.00",'
+             '"v":"12.5","n":340,"x":%s,"q":"848693.75"}}')
+    assert _parse_closed_kline(kline % 'false') is None
+
+    bar = _parse_closed_kline(kline % 'true')
+    assert bar == OHLCV(datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc),
+                        67890.10, 67900.00, 67880.00, 67895.50, 12.5)
+
+    # Pretty-printed frames (space after the colon) still yield the closed bar
+    assert _parse_closed_kline(kline.replace('"x":', '"x": ') % 'true') == bar